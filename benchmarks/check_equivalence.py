@@ -0,0 +1,154 @@
+""" Equivalence checks of the fast statistics paths against the plain scan, on generated logs
+
+- compute_statistics with WindowAggregates gives the same table (2 decimals) as the scan of the window rows
+- stream_statistics (streaming mode) gives the same table as compute_statistics on the loaded log
+- WindowAggregates extended row by row (live mode) are identical to aggregates built at once
+- update_events (live mode) gives the same events as detect_events over the whole timeframe
+
+    python benchmarks/check_equivalence.py --days 120 --windows 400
+
+Exits with 1 if any check fails.
+"""
+import sys
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from generate_logs import load_tool, write_instrument
+
+tool = load_tool()
+STATS_COLUMNS = [column for group in tool.STATS_GROUPS for label, column, sp_column in group]
+
+def random_windows(store, count, rng):
+    """ Row slices of random lengths: single rows, a few rows, around block edges and up to the whole log """
+    n = len(store)
+    block = tool.WindowAggregates.block_size
+    windows = [slice(0, n), slice(0, 1), slice(n - 1, n), slice(block - 1, block + 1), slice(block, 3 * block)]
+    while len(windows) < count:
+        length = int(min(n, rng.choice([1, 5, 100, block, 5 * block, n])) * rng.random()) + 1
+        start = int(rng.integers(0, n - length + 1))
+        windows.append(slice(start, start + length))
+    return [window for window in windows if window.stop <= n]
+
+def check_aggregates(store, windows):
+    """ Windows whose statistics table differs between the aggregates and the scan """
+    aggregates = tool.aggregates_job(store)
+    failed = 0
+    for window in windows:
+        start, end = pd.Timestamp(store['Time'][window.start]), pd.Timestamp(store['Time'][window.stop - 1])
+        scanned = tool.compute_statistics(store, window, start, end)
+        indexed = tool.compute_statistics(store, window, start, end, aggregates=aggregates)
+        if scanned.to_text() != indexed.to_text():
+            failed += 1
+            print(f"aggregates differ on rows {window.start}..{window.stop - 1}:\n{scanned.to_text()}\n{indexed.to_text()}")
+    return failed
+
+def check_streaming(folder, store, rng, count, chunksize):
+    """ Timeframes whose streamed statistics table differs from the one of the loaded log """
+    first, last = store.time_index.start.value, store.time_index.end.value
+    bounds = np.sort(rng.integers(first, last, (count, 2)), axis=1)
+    timeframes = [(pd.Timestamp(lo).floor('min'), pd.Timestamp(hi).floor('min')) for lo, hi in bounds]
+    timeframes.append((store.time_index.start, store.time_index.end))
+    streamed, log_range = tool.stream_statistics(folder, timeframes, chunksize=chunksize)
+    failed = 0
+    if log_range != (store.time_index.start, store.time_index.end):
+        failed += 1
+        print(f"streamed log range {log_range} differs from the loaded one")
+    for (start, end), result in zip(timeframes, streamed):
+        loaded = tool.compute_statistics(store, store.time_index.window(start, end), start, end)
+        if (loaded is None) != (result is None) or (loaded is not None and loaded.to_text() != result.to_text()):
+            failed += 1
+            print(f"streaming differs on {start} - {end}:\n{loaded and loaded.to_text()}\n{result and result.to_text()}")
+    return failed
+
+class Prefix:
+    """ The first 'rows' rows of a store, like a live store before rows were appended """
+    def __init__(self, store, rows):
+        self.store = store
+        self.rows = rows
+
+    def __getitem__(self, name):
+        return self.store[name][:self.rows]
+
+def check_extend(store, windows, rng):
+    """ Differences between aggregates extended in random steps and aggregates built at once """
+    built = tool.WindowAggregates(store, STATS_COLUMNS)
+    rows = int(rng.integers(1, 2 * tool.WindowAggregates.block_size))
+    extended = tool.WindowAggregates(Prefix(store, rows), STATS_COLUMNS)
+    while rows < len(store):
+        rows = min(len(store), rows + int(rng.choice([1, 3, 60, 1440, 20000])))
+        extended.extend(Prefix(store, rows))
+    failed = 0
+    arrays = ['values', 'cum_count', 'cum_sum', 'cum_sq']
+    for name in arrays:
+        if not np.array_equal(getattr(built, name), getattr(extended, name), equal_nan=True):
+            failed += 1
+            print(f"extended aggregates differ in {name}")
+    tables = built.min_table + built.max_table
+    if len(built.min_table) != len(extended.min_table) or not all(
+            np.array_equal(a, b, equal_nan=True) for a, b in zip(tables, extended.min_table + extended.max_table)):
+        failed += 1
+        print("extended aggregates differ in the sparse tables")
+    for name, a, b in zip(STATS_COLUMNS, built.histograms, extended.histograms):
+        if (a is None) != (b is None) or (a is not None and not (np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1]))):
+            failed += 1
+            print(f"extended aggregates differ in the histogram of {name}")
+    for window in windows:
+        if not all(np.array_equal(a, b, equal_nan=True) for a, b in zip(built.query(window), extended.query(window))):
+            failed += 1
+            print(f"extended aggregates query differs on rows {window.start}..{window.stop - 1}")
+    return failed
+
+def event_keys(events):
+    return [(event.kind, event.label, event.start, event.end) for event in events]
+
+def check_events(store, rng):
+    """ Refreshes whose updated events differ from a full detection over the grown timeframe """
+    times = store['Time']
+    first = int(rng.integers(0, len(store) // 4))
+    stop = first + 1440
+    events = tool.detect_events(store, times, slice(first, stop))
+    failed = 0
+    while stop < len(store):
+        grown = min(len(store), stop + int(rng.choice([1, 2, 30, 600])))
+        window = slice(first, grown)
+        events = tool.update_events(store, times, window, events, stop)
+        stop = grown
+        if rng.random() < 0.05 or stop == len(store):
+            detected = tool.detect_events(store, times, window)
+            peaks = [(a.peak is None and b.peak is None) or np.isclose(a.peak, b.peak, rtol=1e-6)
+                     for a, b in zip(detected, events)]
+            if event_keys(detected) != event_keys(events) or not all(peaks):
+                failed += 1
+                print(f"updated events differ from a full detection on rows {first}..{stop - 1}")
+    return failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the fast statistics paths against the plain scan.")
+    parser.add_argument('--days', type=float, default=120, help="days of the generated log")
+    parser.add_argument('--windows', type=int, default=400, help="random windows per check")
+    parser.add_argument('--chunksize', type=int, default=20000, help="rows per chunk of the streaming check")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(args.seed)
+
+    with tempfile.TemporaryDirectory() as folder:
+        write_instrument(folder, '2023-01-01', args.days, seed=args.seed)
+        store = tool.LogStore(tool.load_log_folder(folder, cache_dir=None))
+        windows = random_windows(store, args.windows, rng)
+        checks = [
+            ('aggregates vs scan', lambda: check_aggregates(store, windows)),
+            ('streaming vs loaded', lambda: check_streaming(folder, store, rng, args.windows // 10, args.chunksize)),
+            ('extended vs built aggregates', lambda: check_extend(store, windows, rng)),
+            ('updated vs detected events', lambda: check_events(store, rng)),
+        ]
+        failed = 0
+        for name, check in checks:
+            errors = check()
+            failed += errors
+            print(f"{name:<30} {'ok' if not errors else f'{errors} failed'}", flush=True)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+""" Synthetic incubation log generator for benchmarks and manual testing
+
+Writes semicolon-separated CSV files with the exact 24-column header of the device log, one row per minute, from a day
+up to several instrument-years. Door openings (with temperature/gas dips and their recovery), sensor alarms,
+duplicated rows (within a file and overlapping files) and gaps in the log are injected at random.
+
+    python benchmarks/generate_logs.py OUT_DIR --days 365 --instruments 2
+"""
+import os
+import sys
+import argparse
+import importlib.util
+import numpy as np
+import pandas as pd
+
+TOOL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'incu_log_tool_v1.2.1.py')
+
+def load_tool():
+    """ Import the tool script as a module (its file name is not importable) """
+    spec = importlib.util.spec_from_file_location('incu_log_tool', TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Same 24 columns as LOG_HEADER of the tool; kept here so generating logs does not need the GUI libraries
+LOG_HEADER = ['Time', 'Embryo Temp. Setpoint', 'Embryo Temp. Avg', 'Temp. Sensor A Avg', 'Temp. Sensor B Avg',
+              'Baseplate Temp.', 'Incubator Board Temp.', 'Bottom Chamber Temp.', 'Backside Temp.', 'Top Chamber Temp.',
+              'CO2 Setpoint', 'CO2 Concentration Avg', 'CO2 Pressure Avg', 'CO2 Flow Avg', 'O2 Setpoint',
+              'O2 Concentration Avg', 'O2 Regulator On', 'N2 Pressure Avg', 'N2 Flow Avg', 'UV Light Voltage [mV]',
+              'Temp. Alarm Duration [min]', 'CO2 Alarm Duration [min]', 'O2 Alarm Duration [min]', 'Door Open Duration [s]']
+
+def smooth_noise(rng, n, sigma, span=30):
+    """ Slowly wandering noise: white noise averaged over 'span' minutes, scaled to 'sigma' """
+    noise = np.convolve(rng.normal(0.0, 1.0, n + span), np.ones(span) / np.sqrt(span), mode='valid')[:n]
+    return noise * sigma
+
+def recovery(impulses, minutes):
+    """ Response to the impulses that decays exponentially over about 'minutes' (e.g. after a door opening) """
+    kernel = np.exp(-np.arange(4 * minutes) / minutes)
+    return np.convolve(impulses, kernel)[:len(impulses)]
+
+def generate_rows(start, days, rng, doors_per_day=3.0, alarms_per_day=0.2):
+    """ One instrument's log rows from 'start' for 'days' days as a dataframe with the LOG_HEADER columns """
+    n = int(days * 1440)
+    times = pd.date_range(pd.Timestamp(start) + pd.Timedelta(seconds=3), periods=n, freq='min')
+    white = lambda sigma: rng.normal(0.0, sigma, n)
+
+    # Door openings: seconds open in the minute, and the dip they cause in temperature and CO2 (O2 rises)
+    door = np.zeros(n)
+    openings = rng.random(n) < doors_per_day / 1440
+    door[openings] = rng.integers(5, 60, openings.sum())
+    impact = recovery(door / 60, 12)
+
+    # Sensor faults: short episodes where one controlled value runs off its setpoint
+    faults = {}
+    for name in ('temp', 'co2', 'o2'):
+        episodes = np.zeros(n)
+        starts = np.flatnonzero(rng.random(n) < alarms_per_day / 1440 / 3)
+        for s in starts:
+            episodes[s:s + rng.integers(5, 90)] = rng.choice([-1.0, 1.0]) * rng.uniform(0.6, 1.5)
+        faults[name] = episodes
+
+    temp_sp = np.full(n, 37.0)
+    co2_sp = np.full(n, 6.0 if rng.random() < 0.3 else 7.5)
+    o2_sp = np.full(n, 5.0)
+    temp = temp_sp + smooth_noise(rng, n, 0.02) + white(0.01) - 0.6 * impact + faults['temp']
+    co2 = co2_sp + smooth_noise(rng, n, 0.03) + white(0.02) - 1.5 * impact + faults['co2']
+    o2 = o2_sp + smooth_noise(rng, n, 0.03) + white(0.02) + 2.0 * impact + faults['o2']
+    df = pd.DataFrame({
+        'Time': times.strftime('%Y-%m-%d %H:%M:%S'),
+        'Embryo Temp. Setpoint': temp_sp,
+        'Embryo Temp. Avg': temp,
+        'Temp. Sensor A Avg': temp + 0.24 + white(0.02),
+        'Temp. Sensor B Avg': temp + 0.36 + white(0.02),
+        'Baseplate Temp.': 31.16 + smooth_noise(rng, n, 0.05),
+        'Incubator Board Temp.': 42.43 + smooth_noise(rng, n, 0.1),
+        'Bottom Chamber Temp.': 35.0 + white(0.01) - 0.3 * impact,
+        'Backside Temp.': 31.26 + smooth_noise(rng, n, 0.05),
+        'Top Chamber Temp.': 34.09 + smooth_noise(rng, n, 0.05) - 0.5 * impact,
+        'CO2 Setpoint': co2_sp,
+        'CO2 Concentration Avg': co2,
+        'CO2 Pressure Avg': 0.35 + white(0.03),
+        'CO2 Flow Avg': np.clip(0.38 + white(0.03) + 0.8 * impact, 0.0, None),
+        'O2 Setpoint': o2_sp,
+        'O2 Concentration Avg': o2,
+        'O2 Regulator On': np.ones(n),
+        'N2 Pressure Avg': 0.55 + white(0.03),
+        'N2 Flow Avg': np.clip(1.34 + white(0.1) - 0.5 * impact, 0.0, None),
+        'UV Light Voltage [mV]': 3278.0 + np.round(white(0.2)),
+        # Alarms are raised while a value is more than the alarm band off its setpoint
+        'Temp. Alarm Duration [min]': (np.abs(temp - temp_sp) > 0.5).astype(int),
+        'CO2 Alarm Duration [min]': (np.abs(co2 - co2_sp) > 1.0).astype(int),
+        'O2 Alarm Duration [min]': (np.abs(o2 - o2_sp) > 1.0).astype(int),
+        'Door Open Duration [s]': door.astype(int),
+    }, columns=LOG_HEADER)
+
+    # Gaps: the instrument was off or not logging, now and then for minutes to hours
+    keep = np.ones(n, dtype=bool)
+    for s in np.flatnonzero(rng.random(n) < 0.1 / 1440):
+        keep[s:s + rng.integers(2, 300)] = False
+    df = df[keep]
+    # Rows logged twice
+    duplicates = df.sample(frac=0.0005, random_state=rng.integers(2**31))
+    return pd.concat([df, duplicates]).sort_index(kind='stable').reset_index(drop=True)
+
+def write_instrument(folder, start, days, seed=0, days_per_file=7, overlap=60):
+    """ Write one instrument's log to 'folder' as files of 'days_per_file' days; consecutive files share 'overlap'
+        rows like exports that were taken with some overlap. Returns the written paths """
+    rng = np.random.default_rng(seed)
+    df = generate_rows(start, days, rng)
+    os.makedirs(folder, exist_ok=True)
+    rows_per_file = days_per_file * 1440
+    paths = []
+    for i, first in enumerate(range(0, len(df), rows_per_file)):
+        part = df.iloc[max(first - overlap, 0):first + rows_per_file]
+        path = os.path.join(folder, f'incubation_report_{i:04d}.csv')
+        part.to_csv(path, sep=';', index=False, float_format='%.2f')
+        paths.append(path)
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic incubation logs.")
+    parser.add_argument('out', help="output folder; one sub-folder per instrument")
+    parser.add_argument('--days', type=float, default=30, help="days of log per instrument")
+    parser.add_argument('--instruments', type=int, default=1)
+    parser.add_argument('--start', default='2023-01-01')
+    parser.add_argument('--days-per-file', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    for k in range(args.instruments):
+        folder = os.path.join(args.out, f'i{k + 1:04d}')
+        paths = write_instrument(folder, args.start, args.days, seed=args.seed + k, days_per_file=args.days_per_file)
+        print(f"{folder}: {len(paths)} files")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+""" Benchmarks of the start-up imports and of the loading, statistics and chart stages across log sizes
+
+Generates synthetic logs (see generate_logs.py) once per size and reuses them, times every stage (best and median of
+--repeat runs) and measures its peak Python/NumPy heap with tracemalloc in a separate run, so the timings are not
+slowed down by the tracing. The start-up imports are timed in fresh interpreters. The results are saved as JSON; --compare prints the change against an earlier file.
+
+    python benchmarks/run_benchmarks.py --sizes 1 30 365
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<earlier>.json
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+import numpy as np
+import pandas as pd
+
+# Charts are rendered off-screen
+os.environ.setdefault('MPLBACKEND', 'Agg')
+from generate_logs import TOOL_PATH, load_tool, write_instrument
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+tool = load_tool()
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from tabulate import tabulate
+
+# Statistics timeframes per run, drawn with a fixed seed so runs compare
+STATS_WINDOWS = 20
+
+def stats_windows(store, count=STATS_WINDOWS, seed=0):
+    rng = np.random.default_rng(seed)
+    start, end = store.time_index.start.value, store.time_index.end.value
+    bounds = np.sort(rng.integers(start, end, (count, 2)), axis=1)
+    return [(pd.Timestamp(lo).floor('min'), pd.Timestamp(hi).floor('min')) for lo, hi in bounds]
+
+def stage_load(folder, cache_dir):
+    """ What 'Browse' runs: read, merge and de-duplicate the CSV files, then build the store """
+    store = tool.LogStore(tool.load_log_folder(folder, cache_dir=cache_dir))
+    return store
+
+def stage_statistics(store, windows, aggregates):
+    for start, end in windows:
+        tool.statistics_job(store, start, end, aggregates)
+
+def stage_charts(store, rollups):
+    """ What 'Generate Charts' runs, drawn once on an Agg canvas """
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    tool.draw_chart_figure(fig, tool.prepare_chart_data(store, rollups), 'bench')
+    fig.canvas.draw()
+
+def measure(fn, repeat):
+    """ (best seconds, median seconds, peak MB of the traced heap) of fn() """
+    seconds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - started)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(seconds), float(np.median(seconds)), peak / 2**20
+
+# Imports the tool and its lazily loaded modules in a fresh interpreter and prints their import times
+STARTUP_CODE = (f"import json, importlib.util; spec = importlib.util.spec_from_file_location('incu_log_tool', {TOOL_PATH!r}); "
+                "tool = importlib.util.module_from_spec(spec); spec.loader.exec_module(tool); tool.import_all(); "
+                "print(json.dumps(tool.import_times()['imports']))")
+
+def run_startup(repeat):
+    """ Import time of the script (its eager imports) and of every lazily imported module; returns a list of result dicts """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', STARTUP_CODE], capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.splitlines()[-1]))
+    results = []
+    for name in runs[0]:
+        seconds = [run.get(name, 0.0) for run in runs]
+        results.append({'days': 0, 'rows': 0, 'stage': f'startup: {name}', 'best_s': min(seconds),
+                        'median_s': float(np.median(seconds)), 'peak_mb': None})
+        print(f"{'':>6}  {results[-1]['stage']:<34} {min(seconds):8.3f}s", flush=True)
+    return results
+
+def run_size(days, data_dir, repeat):
+    """ Benchmark every stage on a log of 'days' days; returns a list of result dicts """
+    folder = os.path.join(data_dir, f'{days}d')
+    if not os.path.isdir(folder):
+        write_instrument(folder, '2023-01-01', days, seed=days)
+    results = []
+
+    def record(stage, fn, rows):
+        best, median, peak = measure(fn, repeat)
+        results.append({'days': days, 'rows': rows, 'stage': stage, 'best_s': best, 'median_s': median, 'peak_mb': peak})
+        print(f"{days:>5}d  {stage:<34} {best:8.3f}s  {peak:8.1f} MB", flush=True)
+
+    rows = sum(1 for path in tool.list_log_files(folder) for _ in open(path)) - len(tool.list_log_files(folder))
+    record('concatenate_csv (no cache)', lambda: stage_load(folder, None), rows)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        stage_load(folder, cache_dir)
+        record('concatenate_csv (cached)', lambda: stage_load(folder, cache_dir), rows)
+    store = stage_load(folder, None)
+    windows = stats_windows(store)
+    record('window aggregates', lambda: tool.aggregates_job(store), len(store))
+    record('rollup pyramid', lambda: tool.RollupPyramid(store), len(store))
+    aggregates = tool.aggregates_job(store)
+    rollups = tool.RollupPyramid(store)
+    record(f'calculate_statistics x{STATS_WINDOWS}', lambda: stage_statistics(store, windows, aggregates), len(store))
+    record(f'calculate_statistics x{STATS_WINDOWS} (scan)', lambda: stage_statistics(store, windows, None), len(store))
+    record('generate_charts', lambda: stage_charts(store, rollups), len(store))
+    record('generate_charts (no rollups)', lambda: stage_charts(store, None), len(store))
+    return results
+
+def machine_info():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARK_DIR, capture_output=True,
+                                text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'commit': commit, 'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'python': platform.python_version(),
+            'platform': platform.platform(), 'machine': platform.node(), 'cpus': os.cpu_count(),
+            'numpy': np.__version__, 'pandas': pd.__version__, 'csv_engine': tool.CSV_ENGINE}
+
+def compare(results, baseline, threshold):
+    """ Table of the best times against a baseline result file; returns the number of regressions """
+    old = {(r['days'], r['stage']): r for r in baseline['results']}
+    table = []
+    regressions = 0
+    for r in results:
+        before = old.get((r['days'], r['stage']))
+        if before is None:
+            continue
+        ratio = r['best_s'] / before['best_s'] if before['best_s'] else float('nan')
+        flag = 'slower' if ratio > threshold else ('faster' if ratio < 1 / threshold else '')
+        regressions += flag == 'slower'
+        table.append([r['days'], r['stage'], before['best_s'], r['best_s'], ratio, before['peak_mb'], r['peak_mb'], flag])
+    print(f"\nAgainst {baseline['meta'].get('commit') or '?'} ({baseline['meta'].get('time')}):")
+    print(tabulate(table, ['Days', 'Stage', 'Before(s)', 'Now(s)', 'Ratio', 'Before(MB)', 'Now(MB)', ''],
+                   floatfmt='.3f'))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the incubation log tool on synthetic logs.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 30, 365], help="log sizes in days")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per stage")
+    parser.add_argument('--data', default=os.path.join(BENCHMARK_DIR, 'data'), help="folder of the generated logs")
+    parser.add_argument('--out', default=os.path.join(BENCHMARK_DIR, 'results'), help="folder of the result files")
+    parser.add_argument('--compare', metavar='RESULTS_JSON', help="earlier result file to compare with")
+    parser.add_argument('--threshold', type=float, default=1.2, help="ratio reported as slower/faster")
+    args = parser.parse_args(argv)
+
+    results = run_startup(args.repeat)
+    for days in args.sizes:
+        results.extend(run_size(days, args.data, args.repeat))
+    meta = machine_info()
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, f"{time.strftime('%Y%m%d-%H%M%S')}_{meta['commit'] or 'nogit'}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=1)
+    print(f"\nSaved {path}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        return 1 if compare(results, baseline, args.threshold) else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
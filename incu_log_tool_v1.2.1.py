@@ -1,24 +1,106 @@
 import sys
 import os
-import pandas as pd
+import time
+# Start-up is timed from here (see import_report)
+STARTED = time.perf_counter()
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
+import pickle
+import threading
+import argparse
+import multiprocessing
+import warnings
+import contextlib
+import cProfile
+import pstats
+import tracemalloc
+from collections import namedtuple, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib import axes
-import matplotlib.ticker as ticker
-import matplotlib.dates as mdates
-from matplotlib.lines import Line2D
-from tabulate import tabulate
-tabulate.PRESERVE_WHITESPACE = True
 from PySide2.QtWidgets import (QApplication, QMainWindow, QPushButton, QFileDialog, 
                              QTextEdit, QLabel, QLineEdit, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QFormLayout, QMessageBox)
+                             QWidget, QFormLayout, QMessageBox, QProgressBar, QCheckBox,
+                             QListWidget, QSpinBox, QComboBox, QInputDialog)
 from PySide2.QtGui import QFont, QIcon, QTextDocument
-from PySide2.QtCore import Qt, QSize
-from matplotlib.ticker import FuncFormatter
-import gc # garbage collector
+from PySide2.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal, QFileSystemWatcher, QTimer, qVersion
 
 __version__ = '1.2.1-20250216'
 
+# Import time per module: (seconds, thread that imported it), the eager imports above first
+IMPORT_TIMES = OrderedDict([('eager (numpy, PySide2)', (time.perf_counter() - STARTED, 'MainThread'))])
+# Seconds from STARTED to milestones of the GUI start-up ('window shown')
+STARTUP_TIMES = {}
+_import_lock = threading.Lock()
+
+class LazyModule:
+    """ Stand-in for a heavy module that is imported when one of its attributes is first used
+        The import replaces the global '_alias' with the module, so later lookups do not go through the proxy. """
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def load(self):
+        with _import_lock:
+            imported = self._name in sys.modules
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            if not imported:
+                IMPORT_TIMES[self._name] = (time.perf_counter() - started, threading.current_thread().name)
+        globals()[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+# pandas is needed once a folder is browsed, matplotlib once charts are drawn; the window is shown before either
+pd = LazyModule('pandas', 'pd')
+_tabulate = LazyModule('tabulate', '_tabulate')
+matplotlib = LazyModule('matplotlib', 'matplotlib')
+mdates = LazyModule('matplotlib.dates', 'mdates')
+ticker = LazyModule('matplotlib.ticker', 'ticker')
+mlines = LazyModule('matplotlib.lines', 'mlines')
+mcollections = LazyModule('matplotlib.collections', 'mcollections')
+plt = LazyModule('matplotlib.pyplot', 'plt')
+# Pre-warmed in this order after the window is shown
+LAZY_MODULES = [pd, _tabulate, mdates, ticker, mlines, mcollections, plt]
+# pyqtgraph is optional: it provides the embedded chart view, imported when that is first drawn
+# Its axes fail to draw their labels on Qt older than 5.15, so the view is not offered there
+if importlib.util.find_spec('pyqtgraph') is None:
+    PYQTGRAPH_UNAVAILABLE = 'Install pyqtgraph to draw the charts in this window'
+elif tuple(int(part) for part in qVersion().split('.')[:2]) < (5, 15):
+    PYQTGRAPH_UNAVAILABLE = f'Embedded charts need Qt 5.15 or newer (this is Qt {qVersion()})'
+else:
+    PYQTGRAPH_UNAVAILABLE = None
+HAS_PYQTGRAPH = PYQTGRAPH_UNAVAILABLE is None
+pg = LazyModule('pyqtgraph', 'pg')
+
+def tabulate(*args, **kwargs):
+    return _tabulate.tabulate(*args, **kwargs)
+
+def import_all():
+    """ Import every lazily loaded module now """
+    for module in LAZY_MODULES:
+        if isinstance(module, LazyModule):
+            module.load()
+
+def prewarm_imports():
+    """ Record that the window is shown and import the lazy modules on a background thread, so the first browse
+        or chart does not wait for them; a module used meanwhile is imported once, by whichever thread comes first """
+    STARTUP_TIMES['window shown'] = time.perf_counter() - STARTED
+    threading.Thread(target=import_all, name='prewarm', daemon=True).start()
+
+def import_times():
+    return {'startup': dict(STARTUP_TIMES), 'imports': {name: seconds for name, (seconds, thread) in IMPORT_TIMES.items()}}
+
+def import_report():
+    """ Text of the start-up milestones and the time of every module import """
+    milestones = "".join(f"{name.capitalize()} {seconds:.2f} s after start-up\n" for name, seconds in STARTUP_TIMES.items())
+    table = [[name, seconds, thread] for name, (seconds, thread) in IMPORT_TIMES.items()]
+    return milestones + tabulate(table, ['Import', 'Seconds', 'Thread'], floatfmt='.3f')
+
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -28,12 +110,2173 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+# Column layout of the incubation log CSV files (semicolon separated, one row per minute)
+LOG_HEADER = [
+    'Time', 'Embryo Temp. Setpoint', 'Embryo Temp. Avg', 'Temp. Sensor A Avg',
+    'Temp. Sensor B Avg', 'Baseplate Temp.', 'Incubator Board Temp.',
+    'Bottom Chamber Temp.', 'Backside Temp.', 'Top Chamber Temp.',
+    'CO2 Setpoint', 'CO2 Concentration Avg', 'CO2 Pressure Avg',
+    'CO2 Flow Avg', 'O2 Setpoint', 'O2 Concentration Avg', 'O2 Regulator On',
+    'N2 Pressure Avg', 'N2 Flow Avg', 'UV Light Voltage [mV]',
+    'Temp. Alarm Duration [min]', 'CO2 Alarm Duration [min]',
+    'O2 Alarm Duration [min]', 'Door Open Duration [s]'
+]
+LOG_DTYPE = {
+    'Embryo Temp. Setpoint': 'float32', 'Embryo Temp. Avg': 'float32',
+    'Temp. Sensor A Avg': 'float32', 'Temp. Sensor B Avg': 'float32', 'Baseplate Temp.': 'float32',
+    'Incubator Board Temp.': 'float32', 'Bottom Chamber Temp.': 'float32', 'Backside Temp.': 'float32',
+    'Top Chamber Temp.': 'float32', 'CO2 Setpoint': 'float32', 'CO2 Concentration Avg': 'float32',
+    'CO2 Pressure Avg': 'float32', 'CO2 Flow Avg': 'float32', 'O2 Setpoint': 'float32',
+    'O2 Concentration Avg': 'float32', 'O2 Regulator On': 'bool', 'N2 Pressure Avg': 'float32',
+    'N2 Flow Avg': 'float32', 'UV Light Voltage [mV]': 'float32',
+    'Temp. Alarm Duration [min]': 'float32', 'CO2 Alarm Duration [min]': 'float32',
+    'O2 Alarm Duration [min]': 'float32', 'Door Open Duration [s]': 'float32'
+}
+# Timestamp format written by the device; parsed explicitly instead of letting pandas infer it
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Parsed CSV files are cached as Parquet sidecars, keyed on path + mtime + size; the least recently used sidecars
+# (and chart rollups) are removed beyond the size limit
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.incu_log_tool', 'csv_cache')
+CACHE_BYTES = 1024 * 2**20
+
+# pyarrow is optional: it provides the multithreaded CSV parser and the Parquet cache
+# Only looked up here; pandas imports it when it parses the first file
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+# Resident memory of the process, sampled at the end of every stage: with psutil if installed, else from the
+# Windows API or /proc (Linux); elsewhere it is not shown
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+if psutil is None and sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD), ('PeakWorkingSetSize', ctypes.c_size_t),
+                    ('WorkingSetSize', ctypes.c_size_t), ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPagedPoolUsage', ctypes.c_size_t), ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaNonPagedPoolUsage', ctypes.c_size_t), ('PagefileUsage', ctypes.c_size_t),
+                    ('PeakPagefileUsage', ctypes.c_size_t)]
+
+    _GetCurrentProcess = ctypes.windll.kernel32.GetCurrentProcess
+    _GetCurrentProcess.restype = wintypes.HANDLE
+    _GetProcessMemoryInfo = ctypes.windll.psapi.GetProcessMemoryInfo
+    _GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(_ProcessMemoryCounters), wintypes.DWORD]
+    _GetProcessMemoryInfo.restype = wintypes.BOOL
+
+def process_rss():
+    """ Resident memory (working set) of this process in bytes, or None where it cannot be read """
+    try:
+        if psutil is not None:
+            return psutil.Process().memory_info().rss
+        if sys.platform == 'win32':
+            counters = _ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            if not _GetProcessMemoryInfo(_GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+                return None
+            return counters.WorkingSetSize
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+# tracemalloc peaks are process-wide: a stage only gets one while no other thread runs a traced stage
+_tracing = {'owner': None, 'depth': 0, 'shared': False}
+_tracing_lock = threading.Lock()
+
+# Recorder of the background job running on this thread (see stage())
+_stage_recorder = threading.local()
+
+class StageRecorder:
+    """ Wall time of the named pipeline stages of one job run, filled by stage() on the threads bound to it
+        Every stage gets the resident memory of the process at its end. With 'capture' the run is also profiled with
+        cProfile and the stages that run single-threaded get their tracemalloc peak. """
+    def __init__(self, job, capture=False):
+        self.job = job
+        self.capture = capture
+        self.started = time.time()
+        self.clock = time.perf_counter()
+        self.stages = {}  # name -> {'seconds', 'calls', 'depth', 'peak_mb', 'rss_mb'}, in the order the stages started
+        self.lock = threading.Lock()
+        self.local = threading.local()  # per thread: stack of the open stages' highest nested peak
+        self.profiler = cProfile.Profile() if capture else None
+        self.status = 'running'
+        self.runs = 1
+        self.seconds = None
+        self.rss_mb = None
+        self.profile = None
+
+    def open(self, name, depth):
+        with self.lock:
+            self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0, 'depth': depth, 'peak_mb': None,
+                                         'rss_mb': None})
+
+    def add(self, name, seconds, peak, rss):
+        # Stages of the same name (e.g. one per CSV file) are summed, also over the threads of a pool; of the memory
+        # readings the highest is kept
+        with self.lock:
+            entry = self.stages[name]
+            entry['seconds'] += seconds
+            entry['calls'] += 1
+            if peak is not None:
+                entry['peak_mb'] = max(entry['peak_mb'] or 0.0, peak / 2**20)
+            if rss is not None:
+                entry['rss_mb'] = max(entry['rss_mb'] or 0.0, rss / 2**20)
+
+    def finish(self, status):
+        self.status = status
+        self.seconds = time.perf_counter() - self.clock
+        rss = process_rss()
+        self.rss_mb = rss / 2**20 if rss is not None else None
+        if self.profiler is not None:
+            text = io.StringIO()
+            pstats.Stats(self.profiler, stream=text).sort_stats('cumulative').print_stats(25)
+            self.profile = text.getvalue()
+
+    def merge(self, other):
+        """ Add the stages and the time of a later, finished run of the same job (e.g. the polls of live mode) """
+        for name, entry in other.stages.items():
+            mine = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0, 'depth': entry['depth'], 'peak_mb': None,
+                                                 'rss_mb': None})
+            mine['seconds'] += entry['seconds']
+            mine['calls'] += entry['calls']
+            for key in ('peak_mb', 'rss_mb'):
+                if entry[key] is not None:
+                    mine[key] = max(mine[key] or 0.0, entry[key])
+        self.runs += other.runs
+        self.seconds += other.seconds
+        self.status = other.status
+        self.rss_mb = other.rss_mb
+        self.capture = self.capture or other.capture
+        self.profile = other.profile or self.profile
+
+    def to_dict(self):
+        return {'job': self.job, 'status': self.status, 'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+                'runs': self.runs, 'seconds': self.seconds, 'rss_mb': self.rss_mb, 'capture': self.capture,
+                'stages': [dict(name=name, **entry) for name, entry in self.stages.items()], 'profile': self.profile}
+
+    def to_text(self):
+        header = f"{self.job}: {self.status}"
+        if self.runs > 1:
+            header += f", {self.runs} runs"
+        if self.seconds is not None:
+            header += f", {self.seconds:.3f} s"
+        if self.rss_mb is not None:
+            header += f", process RSS {self.rss_mb:.0f} MB"
+        header += time.strftime(" (since %H:%M:%S)" if self.runs > 1 else " (%H:%M:%S)", time.localtime(self.started))
+        if not self.stages:
+            return header
+        # Nested stages are marked with a dot per level (tabulate strips leading blanks)
+        table = [['· ' * entry['depth'] + name, entry['seconds'], entry['calls'], entry['peak_mb'], entry['rss_mb']]
+                 for name, entry in self.stages.items()]
+        return header + "\n" + tabulate(table, ['Stage', 'Seconds', 'Calls', 'Peak(MB)', 'RSS(MB)'], tablefmt="simple",
+                                         floatfmt=".3f", missingval='')
+
+@contextlib.contextmanager
+def bind_recorder(recorder, profile=True):
+    """ Record the stages run on this thread into 'recorder' (None: no recording), profiling them if it captures """
+    previous = getattr(_stage_recorder, 'current', None)
+    _stage_recorder.current = recorder
+    profiler = recorder.profiler if recorder is not None and profile else None
+    if profiler is not None:
+        try:
+            profiler.enable()
+        except ValueError:
+            profiler = None  # another profiler is active on this interpreter
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        _stage_recorder.current = previous
+
+def with_recorder(fn):
+    """ Wrap 'fn' to record into this thread's recorder when it is run on another thread (e.g. a thread pool) """
+    recorder = getattr(_stage_recorder, 'current', None)
+    if recorder is None:
+        return fn
+    # Stages on the other thread are nested in the stages open here
+    depth = len(recorder.local.__dict__.get('stack', []))
+    def run(*args, **kwargs):
+        recorder.local.stack = [0] * depth
+        with bind_recorder(recorder, profile=False):
+            return fn(*args, **kwargs)
+    return run
+
+@contextlib.contextmanager
+def stage(name):
+    """ Time a pipeline stage into the recorder bound to this thread; without one (e.g. in batch mode) it does nothing """
+    recorder = getattr(_stage_recorder, 'current', None)
+    if recorder is None:
+        yield
+        return
+    stack = recorder.local.__dict__.setdefault('stack', [])
+    recorder.open(name, len(stack))
+    # The first thread to open a traced stage owns the tracemalloc peak until its stages are closed; a traced stage
+    # on another thread meanwhile (a pool, a concurrent job) voids the peaks of the owner's open stages
+    tracing = False
+    if recorder.capture and tracemalloc.is_tracing():
+        with _tracing_lock:
+            if _tracing['owner'] in (None, threading.get_ident()):
+                _tracing['owner'] = threading.get_ident()
+                _tracing['depth'] += 1
+                tracing = True
+            else:
+                _tracing['shared'] = True
+    if tracing:
+        # The peak is reset per stage; what an enclosing stage reached so far is handed on through the stack
+        before = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+    stack.append(0)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        nested = stack.pop()
+        peak = None
+        if tracing:
+            with _tracing_lock:
+                single = not _tracing['shared']
+                _tracing['depth'] -= 1
+                if not _tracing['depth']:
+                    _tracing.update(owner=None, shared=False)
+            if single:
+                peak = max(tracemalloc.get_traced_memory()[1], nested)
+                if stack:
+                    stack[-1] = max(stack[-1], peak, before)
+        recorder.add(name, seconds, peak, process_rss())
+
+
+def list_log_files(folder):
+    """ Return the sorted list of incubation log CSV files in 'folder' """
+    return sorted(os.path.join(folder, f) for f in os.listdir(folder) if f.endswith('.csv'))
+
+def read_log_csv(path, has_header=True):
+    """ Parse one incubation log CSV file (or buffer) with the fast engine and an explicit 'Time' format
+        A last line of a file that is still being written (no line break and not all of its fields) is left out """
+    dtype = dict(LOG_DTYPE, Time=str)
+    engine = CSV_ENGINE
+    if isinstance(path, str):
+        end = LogTail.line_end(path)
+        with open(path, 'rb') as f:
+            f.seek(end)
+            if f.read().count(b';') < len(LOG_HEADER) - 1 and f.tell() > end:
+                # Same boundary as LogTail: the line is read by the live mode once it is complete
+                f.seek(0)
+                path = io.BytesIO(f.read(end))
+                # pyarrow rejects an empty buffer (the header itself is not complete yet)
+                engine = CSV_ENGINE if end else 'c'
+    with stage('parse CSV'):
+        df = pd.read_csv(path, sep=';', names=LOG_HEADER, header=0 if has_header else None, dtype=dtype, engine=engine)
+    with stage('parse dates'):
+        try:
+            df['Time'] = pd.to_datetime(df['Time'], format=TIME_FORMAT)
+        except ValueError:
+            # Fall back to format inference for files written with a different timestamp layout
+            df['Time'] = pd.to_datetime(df['Time'])
+    return df
+
+def cache_path(path, cache_dir=CACHE_DIR):
+    """ Return the Parquet sidecar path of a CSV file; the name changes whenever the file's mtime or size changes """
+    stat = os.stat(path)
+    path_key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f'{path_key}_{stat.st_mtime_ns}_{stat.st_size}.parquet')
+
+def evict_lru(directory, max_bytes, keep=()):
+    """ Remove the least recently used files of a cache 'directory' (oldest modification time first; reads touch
+        their files) until it holds at most 'max_bytes'; the paths in 'keep' and files being written stay """
+    entries = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(directory, name)
+        if name.endswith('.tmp'):
+            continue
+        try:
+            info = os.stat(path)
+        except OSError:
+            continue  # removed by another job meanwhile
+        entries.append((info.st_mtime, info.st_size, path))
+    total = sum(size for mtime, size, path in entries)
+    for mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path in keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue  # in use (Windows) or already removed
+        total -= size
+
+def touch(path):
+    """ Mark a cache file as used, for evict_lru """
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+def load_log_file(path, cache_dir=CACHE_DIR):
+    """ Load one CSV file, from its Parquet sidecar if the file has not changed since it was cached
+        The event durations are reduced to the flag bits (see reduce_event_flags), also in the sidecar """
+    if CSV_ENGINE != 'pyarrow' or cache_dir is None:
+        return reduce_event_flags(read_log_csv(path))
+    sidecar = cache_path(path, cache_dir)
+    if os.path.exists(sidecar):
+        try:
+            with stage('read Parquet cache'):
+                df = pd.read_parquet(sidecar)
+            touch(sidecar)
+            return reduce_event_flags(df)
+        except Exception:
+            pass  # Corrupt or unreadable sidecar: parse the CSV again and overwrite it
+    df = reduce_event_flags(read_log_csv(path))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Remove sidecars of older versions of the same file before writing the new one
+        path_key = os.path.basename(sidecar).split('_')[0]
+        for old in os.listdir(cache_dir):
+            if old.startswith(path_key + '_') and old != os.path.basename(sidecar):
+                os.remove(os.path.join(cache_dir, old))
+        with stage('write Parquet cache'):
+            df.to_parquet(sidecar, index=False)
+    except OSError:
+        pass  # Caching is best effort; a read-only profile must not break loading
+    return df
+
+class JobCancelled(Exception):
+    """ Raised inside a background job when it has been cancelled or superseded """
+
+def load_log_folder(folder, max_workers=None, cache_dir=CACHE_DIR, progress=None, is_cancelled=None):
+    """ Load every CSV file of 'folder' on a thread pool and return one dataframe of their rows, in the order of the
+        files and with 'Time' floored to minutes; LogStore sorts and de-duplicates it
+        'progress(done, total, message)' is called after each file; 'is_cancelled()' is polled between files """
+    all_files = list_log_files(folder)
+    if not all_files:
+        raise FileNotFoundError(f"No .csv files found in {folder}")
+    # pyarrow parsing and Parquet reads release the GIL, so a thread pool gives real parallelism
+    df_list = [None] * len(all_files)
+    # The per-file stages (parsing, cache) are summed over the pool threads
+    with stage('read CSV files'), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(with_recorder(load_log_file), f, cache_dir): i for i, f in enumerate(all_files)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            if is_cancelled is not None and is_cancelled():
+                for pending in futures:
+                    pending.cancel()
+                raise JobCancelled()
+            i = futures[future]
+            df_list[i] = future.result()
+            if progress is not None:
+                progress(done, len(all_files), os.path.basename(all_files[i]))
+        # The futures hold the frames as well
+        futures.clear()
+    if CSV_ENGINE == 'pyarrow' and cache_dir is not None:
+        with stage('evict cache'):
+            evict_lru(cache_dir, CACHE_BYTES, keep={cache_path(f, cache_dir) for f in all_files})
+    with stage('concatenate'):
+        raw_df = pd.concat(df_list, ignore_index=True)
+        df_list.clear()
+
+    # Just floor to minutes after parsing
+    with stage('floor to minutes'):
+        raw_df['Time'] = raw_df['Time'].dt.floor('min')
+    return raw_df
+
+# Rows per chunk in streaming mode
+STREAM_CHUNKSIZE = 50000
+
+def iter_log_chunks(path, chunksize=STREAM_CHUNKSIZE, usecols=None):
+    """ Read one CSV file in chunks; 'Time' is parsed with the explicit format and floored to minutes """
+    dtype = dict(LOG_DTYPE, Time=str)
+    # The pyarrow engine has no chunked reader, so streaming uses the C engine
+    reader = pd.read_csv(path, sep=';', names=LOG_HEADER, header=0, dtype=dtype, usecols=usecols, chunksize=chunksize)
+    for chunk in reader:
+        try:
+            chunk['Time'] = pd.to_datetime(chunk['Time'], format=TIME_FORMAT)
+        except ValueError:
+            chunk['Time'] = pd.to_datetime(chunk['Time'])
+        chunk['Time'] = chunk['Time'].dt.floor('min')
+        yield chunk.sort_values(by='Time', kind='stable')
+
+def first_log_time(path):
+    """ 'Time' of the first row of a CSV file, floored to minutes like iter_log_chunks, or None if it has no rows """
+    first = pd.read_csv(path, sep=';', names=LOG_HEADER, header=0, usecols=['Time'], dtype=str, nrows=1)
+    if first.empty:
+        return None
+    try:
+        time_value = pd.to_datetime(first['Time'], format=TIME_FORMAT)
+    except ValueError:
+        time_value = pd.to_datetime(first['Time'])
+    return time_value.dt.floor('min').iloc[0]
+
+def stream_log_folder(folder, chunksize=STREAM_CHUNKSIZE, usecols=None, is_cancelled=None):
+    """ Yield the rows of all CSV files of 'folder' as time-sorted, de-duplicated chunks with bounded memory
+        The files are k-way merged on 'Time' (each file is expected to be time-ordered, as the device writes it):
+        rows up to the smallest last 'Time' of the buffered chunks are final and are emitted together. A file is
+        only opened once its first 'Time' is reached, so files that do not overlap cost one chunk at a time. """
+    all_files = list_log_files(folder)
+    if not all_files:
+        raise FileNotFoundError(f"No .csv files found in {folder}")
+    # Files by their first 'Time' (peeked from the first row); files without rows are left out
+    starts = [(first_log_time(f), i) for i, f in enumerate(all_files)]
+    pending = sorted((start, i) for start, i in starts if start is not None)
+    pending.reverse()  # popped from the end
+    readers = {}
+    buffers = {}  # file index -> buffered chunk of the open files
+    last_time = None
+    while True:
+        if is_cancelled is not None and is_cancelled():
+            raise JobCancelled()
+        if not buffers and not pending:
+            return
+        watermark = min((buffer['Time'].iloc[-1] for buffer in buffers.values()), default=None)
+        # Open the files that start at or before the watermark; they may lower it
+        while pending and (watermark is None or pending[-1][0] <= watermark):
+            start, i = pending.pop()
+            readers[i] = iter_log_chunks(all_files[i], chunksize, usecols)
+            buffers[i] = next(readers[i], None)
+            if buffers[i] is None:
+                del buffers[i], readers[i]
+            elif watermark is None or buffers[i]['Time'].iloc[-1] < watermark:
+                watermark = buffers[i]['Time'].iloc[-1]
+        if watermark is None:
+            continue
+        pieces = []
+        for i in sorted(buffers):
+            # Take the final rows of every buffer; refill a buffer once it is used up, close the file at its end
+            cut = int(buffers[i]['Time'].searchsorted(watermark, side='right'))
+            pieces.append(buffers[i].iloc[:cut])
+            buffers[i] = buffers[i].iloc[cut:]
+            while buffers[i] is not None and buffers[i].empty:
+                buffers[i] = next(readers[i], None)
+            if buffers[i] is None:
+                del buffers[i], readers[i]
+        # Rows of earlier files win on duplicate minutes, like in load_log_folder
+        merged = pd.concat(pieces, ignore_index=True).sort_values(by='Time', kind='stable').drop_duplicates(subset='Time')
+        if last_time is not None:
+            merged = merged[merged['Time'] > last_time]
+        if not merged.empty:
+            last_time = merged['Time'].iloc[-1]
+            yield merged.reset_index(drop=True)
+
+class LogTail:
+    """ Follows the CSV files of a log folder while the device appends to them
+        A byte offset is kept per file (always at the start of a line), so a poll parses only the lines written
+        since the previous one. Files that appear later are read from the start; a file that shrank is re-read. """
+    def __init__(self, folder):
+        self.folder = folder
+        # Start at the current end of every file; a line still being written is read once it is complete
+        self.offsets = {path: self.line_end(path) for path in list_log_files(folder)}
+
+    @staticmethod
+    def line_end(path, tail_bytes=65536):
+        """ Byte offset just after the last complete line of a file """
+        size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            f.seek(max(size - tail_bytes, 0))
+            data = f.read()
+        newline = data.rfind(b'\n')
+        return size - len(data) + newline + 1 if newline >= 0 else 0
+
+    def paths(self):
+        return list(self.offsets)
+
+    def poll(self):
+        """ Return the complete rows appended since the last poll as a time-sorted, de-duplicated dataframe, or None """
+        df_list = []
+        for path in list_log_files(self.folder):
+            offset = self.offsets.get(path, 0)
+            size = os.path.getsize(path)
+            if size < offset:
+                offset = 0
+            if size == offset:
+                continue
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(size - offset)
+            complete = data.rfind(b'\n') + 1
+            if complete == 0:
+                continue
+            self.offsets[path] = offset + complete
+            df_list.append(read_log_csv(io.BytesIO(data[:complete]), has_header=(offset == 0)))
+        if not df_list:
+            return None
+        new_df = reduce_event_flags(pd.concat(df_list, ignore_index=True))
+        new_df['Time'] = new_df['Time'].dt.floor('min')
+        return new_df.sort_values(by='Time', kind='stable').drop_duplicates(subset='Time').reset_index(drop=True)
+
+def tail_job(tail, progress=None, is_cancelled=None):
+    """ Background job: the rows appended to a followed log folder (see LogTail.poll) """
+    return tail.poll()
+
+
+def event_intervals(times, mask, step=np.timedelta64(1, 'm')):
+    """ Merge consecutive flagged minutes into (start, end) intervals; a gap in the log splits an interval """
+    times = np.asarray(times, dtype='datetime64[ns]')
+    flagged = times[np.asarray(mask, dtype=bool)]
+    if flagged.size == 0:
+        return flagged, flagged
+    # A new interval starts wherever two flagged samples are more than one logging step apart
+    breaks = np.flatnonzero(np.diff(flagged) > step)
+    starts = flagged[np.concatenate(([0], breaks + 1))]
+    ends = flagged[np.concatenate((breaks, [flagged.size - 1]))] + step
+    return starts, ends
+
+def marker_verts(intervals, ymin, ymax):
+    """ One rectangle per interval; x in data coordinates, y in axes coordinates like axvline() """
+    starts, ends = intervals
+    verts = np.empty((len(starts), 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = mdates.date2num(starts)
+    verts[:, 2, 0] = verts[:, 3, 0] = mdates.date2num(ends)
+    verts[:, [0, 3], 1] = ymin
+    verts[:, [1, 2], 1] = ymax
+    return verts
+
+def add_event_markers(ax, intervals, color, linestyle, ymin, ymax, flag=None):
+    """ Draw event intervals on 'ax' as a single collection artist spanning ymin..ymax (axes fraction)
+        The collection is tagged with its 'flag' (gid), so live mode finds it to extend it """
+    if len(intervals[0]) == 0:
+        return None
+    markers = mcollections.PolyCollection(marker_verts(intervals, ymin, ymax), facecolors=color, edgecolors=color,
+                                          linestyles=linestyle, linewidths=0.75, transform=ax.get_xaxis_transform())
+    markers.set_gid(flag)
+    ax.add_collection(markers, autolim=False)
+    return markers
+
+def extend_event_markers(ax, intervals, color, linestyle, ymin, ymax, flag=None):
+    """ Add event intervals after the ones drawn by add_event_markers to the same collection
+        An interval that starts where the last one ends (an event running across the new rows) is merged into it. """
+    if len(intervals[0]) == 0:
+        return
+    markers = next((c for c in ax.collections if c.get_gid() == flag), None)
+    if markers is None:
+        add_event_markers(ax, intervals, color, linestyle, ymin, ymax, flag)
+        return
+    verts = np.array([path.vertices[:4] for path in markers.get_paths()])
+    new = marker_verts(intervals, ymin, ymax)
+    if new[0, 0, 0] <= verts[-1, 2, 0]:
+        verts[-1, 2:, 0] = new[0, 2, 0]
+        new = new[1:]
+    markers.set_verts(np.concatenate((verts, new)))
+
+def event_markers(axes):
+    """ (axes, flag, style) of the marker collections: door openings on every chart, the temp/CO2/O2 alarms on their own
+        chart; ymin and ymax set the height of the marker """
+    door = dict(color='black', linestyle='-.', ymin=0.00, ymax=0.04)
+    alarm = dict(color='red', linestyle='dotted', ymin=0.95, ymax=1.0)
+    return [(ax, 'door_open', door) for ax in axes] + [(axes[0], 'temp_alarm', alarm), (axes[1], 'co2_alarm', alarm),
+                                                       (axes[2], 'o2_alarm', alarm)]
+
+def draw_event_markers(axes, intervals):
+    """ Mark door openings on every chart and the temp/CO2/O2 alarms on their own chart """
+    for ax, flag, style in event_markers(axes):
+        add_event_markers(ax, intervals[flag], flag=flag, **style)
+
+def m4_indices(y, lo, hi, buckets):
+    """ Row positions lo..hi-1 reduced with M4 decimation: the first, last, minimum and maximum sample of each of
+        'buckets' equal-sized buckets, so every spike survives. The first NaN of a bucket is kept to preserve gaps. """
+    n = hi - lo
+    if n <= 4 * buckets:
+        return np.arange(lo, hi)
+    values = y[lo:hi]
+    nan = np.isnan(values)
+    starts = (np.arange(buckets) * n) // buckets
+    sizes = np.diff(np.append(starts, n))
+
+    def first_per_bucket(hits):
+        # First of the given positions in every bucket that has one
+        bucket = np.searchsorted(starts, hits, side='right') - 1
+        return hits[np.unique(bucket, return_index=True)[1]]
+
+    picks = [starts, starts + sizes - 1, first_per_bucket(np.flatnonzero(nan))]
+    for filled, reduce in ((np.where(nan, np.inf, values), np.minimum), (np.where(nan, -np.inf, values), np.maximum)):
+        extreme = np.repeat(reduce.reduceat(filled, starts), sizes)
+        picks.append(first_per_bucket(np.flatnonzero(filled == extreme)))
+    return lo + np.unique(np.concatenate(picks))
+
+class ChartDecimator:
+    """ Plots time series decimated (M4) to about the pixel width of their axes
+        Zooming or panning (xlim_changed) re-renders the visible range from the full-resolution data, so a narrow
+        range is drawn with every sample while the overview stays fast. """
+    def __init__(self, times, rollups=None):
+        self.times = times
+        self.x = mdates.date2num(times)
+        self.rollups = rollups  # RollupPyramid; long ranges are drawn from its buckets
+        self.lines = []  # (line, y)
+        self.xlim = None
+
+    def buckets(self, ax):
+        # One bucket per horizontal pixel of the axes
+        return max(int(ax.bbox.width), 100)
+
+    def series(self, ax, y, column, lo, hi):
+        """ Points of rows lo..hi-1 of 'y': the envelope of the coarsest rollup level with a bucket per pixel, else M4 """
+        buckets = self.buckets(ax)
+        rollups = self.rollups
+        if rollups is not None and lo < hi <= rollups.rows and column in rollups.positions:
+            level = rollups.pick(self.times[hi - 1] - self.times[lo], buckets)
+            if level is not None:
+                # The envelope is reduced to the pixel width like the rows, from buckets instead of rows
+                times, values = rollups.envelope(level, column, self.times[lo], self.times[hi - 1])
+                idx = m4_indices(values, 0, len(values), buckets)
+                return times[idx], values[idx]
+        idx = m4_indices(y, lo, hi, buckets)
+        return self.times[idx], y[idx]
+
+    def plot(self, ax, y, **kwargs):
+        # Lines are labelled with their store column
+        line, = ax.plot(*self.series(ax, y, kwargs.get('label'), 0, len(y)), **kwargs)
+        self.adopt(line, y)
+        return line
+
+    def adopt(self, line, y):
+        """ Re-render 'line' (drawn here or restored with its figure) from the full-resolution 'y' """
+        self.lines.append((line, y))
+        line.axes.callbacks.connect('xlim_changed', self.on_xlim_changed)
+
+    def on_xlim_changed(self, ax):
+        # All chart axes share the x-axis, so one change re-renders every line
+        xlim = tuple(ax.get_xlim())
+        if xlim == self.xlim:
+            return
+        self.xlim = xlim
+        # Include one sample beyond each edge so lines run to the border of the axes
+        lo = max(int(np.searchsorted(self.x, xlim[0], side='left')) - 1, 0)
+        hi = min(int(np.searchsorted(self.x, xlim[1], side='right')) + 1, len(self.x))
+        for line, y in self.lines:
+            line.set_data(*self.series(line.axes, y, line.get_label(), lo, hi))
+        ax.figure.canvas.draw_idle()
+
+    def extend(self, store):
+        """ Take the longer columns of a grown store (every line is labelled with its column) and re-render
+            A view that reaches the previous end of the data moves along with the new rows. """
+        if not self.lines:
+            return
+        previous_end = self.x[-1]
+        self.times = store['Time']
+        self.x = np.concatenate((self.x, mdates.date2num(self.times[len(self.x):])))
+        self.lines = [(line, store[line.get_label()]) for line, y in self.lines]
+        ax = self.lines[0][0].axes
+        xlim = ax.get_xlim()
+        self.xlim = None
+        if xlim[1] >= previous_end:
+            ax.set_xlim(xlim[0], xlim[1] + (self.x[-1] - previous_end))
+        else:
+            self.on_xlim_changed(ax)
+
+    def on_resize(self, event):
+        # Re-render for the new pixel width
+        if self.lines:
+            self.xlim = None
+            self.on_xlim_changed(self.lines[0][0].axes)
+
+
+class TimeIndex:
+    """ Time-ordered, de-duplicated 'Time' column with cached bounds and O(log n) window lookups """
+    def __init__(self, times):
+        self.times = np.asarray(times, dtype='datetime64[ns]')
+        # The data range is fixed once loaded, so the bounds are computed only once
+        self.start = pd.Timestamp(self.times[0]) if len(self.times) else None
+        self.end = pd.Timestamp(self.times[-1]) if len(self.times) else None
+
+    def __len__(self):
+        return len(self.times)
+
+    def contains(self, start, end):
+        return self.start is not None and self.start <= start and end <= self.end
+
+    def window(self, start, end):
+        """ Return the row slice of the timeframe start..end (inclusive); slicing columns with it does not copy """
+        lo = np.searchsorted(self.times, np.datetime64(start, 'ns'), side='left')
+        hi = np.searchsorted(self.times, np.datetime64(end, 'ns'), side='right')
+        return slice(int(lo), int(max(lo, hi)))
+
+# Column groups of the log store: sensors of the incubation stats and graphs ('main') and of the 'Other' stats
+MAIN_COLUMNS = ['Embryo Temp. Setpoint', 'Embryo Temp. Avg', 'CO2 Setpoint', 'CO2 Concentration Avg', 'CO2 Pressure Avg',
+                'CO2 Flow Avg', 'O2 Setpoint', 'O2 Concentration Avg', 'O2 Regulator On', 'N2 Pressure Avg', 'N2 Flow Avg']
+OTHER_COLUMNS = ['Temp. Sensor A Avg', 'Temp. Sensor B Avg', 'Baseplate Temp.', 'Incubator Board Temp.',
+                 'Bottom Chamber Temp.', 'Backside Temp.', 'Top Chamber Temp.', 'UV Light Voltage [mV]']
+# Event flags packed into one bitmask column: flag name -> (bit, source duration column)
+EVENT_FLAGS = {
+    'temp_alarm': (1, 'Temp. Alarm Duration [min]'),
+    'co2_alarm': (2, 'CO2 Alarm Duration [min]'),
+    'o2_alarm': (4, 'O2 Alarm Duration [min]'),
+    'door_open': (8, 'Door Open Duration [s]'),
+}
+# Column of the flag bits in the dataframes of load_log_file and LogTail.poll
+FLAGS_COLUMN = 'Event Flags'
+
+def reduce_event_flags(df):
+    """ Replace the event duration columns of a log dataframe by the uint8 FLAGS_COLUMN, in place; returns 'df'
+        The durations are only needed for 'event happened in this minute', so they are reduced to one bit each. """
+    if FLAGS_COLUMN in df:
+        return df
+    flags = np.zeros(len(df), dtype=np.uint8)
+    for bit, source in EVENT_FLAGS.values():
+        flags[df[source].to_numpy() > 0] |= bit
+    df.drop(columns=[source for bit, source in EVENT_FLAGS.values()], inplace=True)
+    df[FLAGS_COLUMN] = flags
+    return df
+
+class LogStore:
+    """ The loaded incubation log, held once: the time index, one float32 block with the 'main' and 'other' sensor
+        columns and a uint8 bitmask of the alarm/door event flags
+        The arrays are views on buffers with spare capacity, so appending live rows costs amortized O(new rows). """
+    def __init__(self, raw_df):
+        """ Store the rows of 'raw_df' (see load_log_folder) sorted by 'Time'; of rows with the same minute the first
+            is kept. The columns of 'raw_df' are dropped once they are copied, so the log is not held twice. """
+        self.columns = MAIN_COLUMNS + OTHER_COLUMNS
+        self.positions = {name: j for j, name in enumerate(self.columns)}
+        self.fingerprint = None  # state of the source files (see folder_fingerprint), set by load_log_data
+        with stage('sort and de-duplicate'):
+            times = raw_df['Time'].to_numpy()
+            order = np.argsort(times, kind='stable')
+            keep = np.empty(len(order), dtype=bool)
+            keep[:1] = True
+            np.not_equal(times[order[1:]], times[order[:-1]], out=keep[1:])
+            rows = order[keep]
+            del times, order, keep
+        self._allocate(len(rows))
+        with stage('fill store'):
+            self._fill(0, raw_df, rows)
+        self._publish(len(rows))
+
+    def _allocate(self, capacity):
+        self._times = np.empty(capacity, dtype='datetime64[ns]')
+        # Fortran order keeps every column contiguous, and both column groups are plain slices of the block
+        self._values = np.empty((capacity, len(self.columns)), dtype=np.float32, order='F')
+        self._flags = np.zeros(capacity, dtype=np.uint8)
+
+    def _fill(self, first, raw_df, rows=None):
+        """ Copy the rows of 'raw_df' to the buffers from row 'first' on; with 'rows' (positions) those rows in that
+            order, dropping every column of 'raw_df' once it is copied """
+        # Frames with the event durations (e.g. read with read_log_csv) are reduced to the flag bits first
+        reduce_event_flags(raw_df)
+
+        def column(name):
+            values = raw_df[name].to_numpy()
+            if rows is None:
+                return values
+            del raw_df[name]
+            return values.take(rows)
+
+        target = slice(first, first + (len(raw_df) if rows is None else len(rows)))
+        self._times[target] = column('Time')
+        for j, name in enumerate(self.columns):
+            self._values[target, j] = column(name)
+        self._flags[target] = column(FLAGS_COLUMN)
+
+    def _publish(self, size):
+        # New views (and a new time index) per size; arrays handed out earlier keep their length
+        self.time_index = TimeIndex(self._times[:size])
+        self.values = self._values[:size]
+        self.flags = self._flags[:size]
+
+    def append(self, raw_df):
+        """ Append the rows of a time-sorted dataframe that are newer than the log; returns the number of rows added """
+        if len(self):
+            raw_df = raw_df[raw_df['Time'] > self.time_index.end]
+        size = len(self)
+        if raw_df.empty:
+            return 0
+        if size + len(raw_df) > len(self._times):
+            # Grow geometrically; the old buffers stay valid for views still held by running jobs and open charts
+            times, values, flags = self.time_index.times, self.values, self.flags
+            self._allocate(max(2 * len(self._times), size + len(raw_df)))
+            self._times[:size] = times
+            self._values[:size] = values
+            self._flags[:size] = flags
+        self._fill(size, raw_df)
+        self._publish(size + len(raw_df))
+        # The store no longer matches the state of the files it was loaded from, so it is not cached any more
+        self.fingerprint = None
+        return len(raw_df)
+
+    def __len__(self):
+        return len(self.time_index)
+
+    def __getitem__(self, name):
+        """ Zero-copy column lookup; 'Time' returns the time index values """
+        if name == 'Time':
+            return self.time_index.times
+        return self.values[:, self.positions[name]]
+
+    def flag(self, name):
+        """ Boolean array of one event flag ('temp_alarm', 'co2_alarm', 'o2_alarm', 'door_open') """
+        return (self.flags & EVENT_FLAGS[name][0]) != 0
+
+    def group_frame(self, group):
+        """ The 'main' or 'other' column group as a DataFrame view on the store, indexed by time """
+        columns = MAIN_COLUMNS if group == 'main' else OTHER_COLUMNS
+        first = self.positions[columns[0]]
+        return pd.DataFrame(self.values[:, first:first + len(columns)], columns=columns,
+                            index=pd.DatetimeIndex(self.time_index.times, name='Time'), copy=False)
+
+    @property
+    def main(self):
+        return self.group_frame('main')
+
+    @property
+    def other(self):
+        return self.group_frame('other')
+
+    def memory_usage(self):
+        """ Bytes held by the store, including spare capacity """
+        return self._values.nbytes + self._flags.nbytes + self._times.nbytes
+
+def folder_fingerprint(folder):
+    """ Key of the current state of a log folder: '<folder key>_<hash of the paths, mtimes and sizes of its CSV files>' """
+    folder_key = hashlib.sha1(os.path.abspath(folder).encode('utf-8')).hexdigest()[:16]
+    digest = hashlib.sha1()
+    for path in list_log_files(folder):
+        digest.update(cache_path(path, '').encode('utf-8'))
+    return f'{folder_key}_{digest.hexdigest()[:16]}'
+
+def load_log_data(folder, progress=None, is_cancelled=None):
+    """ Background job: load a log folder into a LogStore """
+    # Taken before reading, so files changing meanwhile give a key that is never looked up again
+    fingerprint = folder_fingerprint(folder)
+    raw_df = load_log_folder(folder, progress=progress, is_cancelled=is_cancelled)
+    if is_cancelled is not None and is_cancelled():
+        raise JobCancelled()
+    with stage('build store'):
+        store = LogStore(raw_df)
+    store.fingerprint = fingerprint
+    return store
+
+# Levels of the rollup pyramid: (name, bucket width), finest first
+ROLLUP_LEVELS = [('5min', np.timedelta64(5, 'm')), ('1h', np.timedelta64(1, 'h')), ('1D', np.timedelta64(1, 'D'))]
+
+# One level of the pyramid; every field has a row per bucket (bucket start 'times') and a column per store column,
+# 'm2' is the sum of squared deviations from the bucket mean and 'events' counts the rows of every EVENT_FLAGS flag
+Rollup = namedtuple('Rollup', ['times', 'count', 'min', 'max', 'mean', 'm2', 'events'])
+
+def rollup_buckets(times, values, flags, width):
+    """ Aggregate time-sorted rows into buckets of 'width' aligned to midnight; buckets without rows are kept with a
+        zero count (and NaN values), so a gap in the log stays a gap at every level """
+    epoch = np.datetime64(0, 'ns')
+    ids = (times - epoch) // width
+    first_id = ids[0]
+    ids -= first_id
+    starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+    present = ids[starts]
+    n_buckets = int(ids[-1]) + 1
+
+    def dense(per_bucket, fill):
+        out = np.full((n_buckets,) + per_bucket.shape[1:], fill, dtype=per_bucket.dtype)
+        out[present] = per_bucket
+        return out
+
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0).astype(np.float64)
+    count = np.add.reduceat(valid.astype(np.int32), starts, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.add.reduceat(filled, starts, axis=0) / count
+        # Squared deviations from the own bucket mean keep float32 precise enough for combining levels
+        deviation = np.where(valid, values - np.repeat(mean, np.diff(np.append(starts, len(values))), axis=0), 0.0)
+    m2 = np.add.reduceat(deviation * deviation, starts, axis=0)
+    bits = np.array([bit for bit, source in EVENT_FLAGS.values()], dtype=np.uint8)
+    events = np.add.reduceat(((flags[:, None] & bits) != 0).astype(np.int32), starts, axis=0)
+    return Rollup(epoch + (first_id + np.arange(n_buckets)) * width,
+                  dense(count, 0),
+                  dense(np.fmin.reduceat(values, starts, axis=0), np.nan),
+                  dense(np.fmax.reduceat(values, starts, axis=0), np.nan),
+                  dense(mean.astype(np.float32), np.nan),
+                  dense(m2.astype(np.float32), 0.0),
+                  dense(events, 0))
+
+class RollupPyramid:
+    """ Per-bucket count/min/max/mean/sum of squares of every store column and event counts at 5-min, hourly and
+        daily resolution, so long ranges are drawn from a few thousand buckets instead of every minute row """
+    def __init__(self, store):
+        self.columns = store.columns
+        self.positions = store.positions
+        self.levels = {}
+        self.rows = 0
+        times = store.time_index.times
+        if len(times):
+            self.rows = len(times)
+            # Every level straight from the rows; the views are cut to one length in case rows are appended meanwhile
+            for name, width in ROLLUP_LEVELS:
+                self.levels[name] = rollup_buckets(times, store.values[:self.rows], store.flags[:self.rows], width)
+
+    def extend(self, store):
+        """ Take the rows appended to 'store' (live mode): only the last bucket of every level and the new ones are rebuilt """
+        times = store.time_index.times
+        if len(times) <= self.rows:
+            return
+        if not self.levels:
+            self.__init__(store)
+            return
+        for name, width in ROLLUP_LEVELS:
+            level = self.levels[name]
+            first = int(np.searchsorted(times, level.times[-1]))
+            tail = rollup_buckets(times[first:], store.values[first:len(times)], store.flags[first:len(times)], width)
+            self.levels[name] = Rollup(*(np.concatenate((old[:-1], new)) for old, new in zip(level, tail)))
+        self.rows = len(times)
+
+    def pick(self, span, buckets):
+        """ The coarsest level with at least 'buckets' buckets over 'span' (a timedelta64), or None for the rows """
+        picked = None
+        for name, width in ROLLUP_LEVELS:
+            if name in self.levels and span // width >= buckets:
+                picked = name
+        return picked
+
+    def envelope(self, name, column, start, end):
+        """ (times, values) tracing the bucket minima and maxima of 'column' between start and end at level 'name'
+            Every bucket gives its minimum at its start and its maximum half a bucket later, which at a bucket per
+            pixel or less draws the same band as the rows; a bucket without rows gives NaNs that break the line """
+        level = self.levels[name]
+        width = dict(ROLLUP_LEVELS)[name]
+        lo = max(int(np.searchsorted(level.times, start, side='right')) - 1, 0)
+        hi = min(int(np.searchsorted(level.times, end, side='right')) + 1, len(level.times))
+        j = self.positions[column]
+        times = np.empty(2 * (hi - lo), dtype='datetime64[ns]')
+        times[0::2] = level.times[lo:hi]
+        times[1::2] = level.times[lo:hi] + width // 2
+        values = np.empty(2 * (hi - lo), dtype=np.float32)
+        values[0::2] = level.min[lo:hi, j]
+        values[1::2] = level.max[lo:hi, j]
+        return times, values
+
+    def save(self, path):
+        arrays = {f'{name}_{field}': array for name, level in self.levels.items() for field, array in level._asdict().items()}
+        np.savez(path, rows=self.rows, columns=np.array(self.columns), **arrays)
+
+    @classmethod
+    def load(cls, path, store):
+        """ Rollups saved for the same rows and columns of 'store', or None """
+        with np.load(path) as data:
+            if int(data['rows']) != len(store) or list(data['columns']) != store.columns:
+                return None
+            pyramid = cls.__new__(cls)
+            pyramid.columns = store.columns
+            pyramid.positions = store.positions
+            pyramid.rows = len(store)
+            pyramid.levels = {name: Rollup(*(data[f'{name}_{field}'] for field in Rollup._fields))
+                              for name, width in ROLLUP_LEVELS if f'{name}_times' in data}
+        return pyramid
+
+def rollups_job(store, cache_dir=CACHE_DIR, progress=None, is_cancelled=None):
+    """ Background job: the RollupPyramid of a store, from the cache next to the CSV sidecars when its files are unchanged """
+    if cache_dir is None or store.fingerprint is None:
+        return RollupPyramid(store)
+    path = os.path.join(cache_dir, f'rollups_{store.fingerprint}.npz')
+    if os.path.exists(path):
+        try:
+            pyramid = RollupPyramid.load(path, store)
+            if pyramid is not None:
+                touch(path)
+                return pyramid
+        except Exception:
+            pass  # Corrupt or outdated file: build the rollups again and overwrite it
+    pyramid = RollupPyramid(store)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Remove the rollups of older states of the same folder before writing the new one
+        folder_key = store.fingerprint.split('_')[0]
+        for old in os.listdir(cache_dir):
+            if old.startswith(f'rollups_{folder_key}_') and old != os.path.basename(path):
+                os.remove(os.path.join(cache_dir, old))
+        pyramid.save(path)
+        evict_lru(cache_dir, CACHE_BYTES, keep={path})
+    except OSError:
+        pass  # Caching is best effort, like the CSV sidecars
+    return pyramid
+
+# Statistics and charts of earlier requests, reused while the CSV files are unchanged (see ResultCache)
+RESULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.incu_log_tool', 'result_cache')
+RESULT_CACHE_BYTES = 256 * 2**20
+
+class ResultCache:
+    """ Content-addressed files of computed results, named '<folder fingerprint>_<kind>_<hash of the request>'
+        Any change of the CSV files changes the fingerprint, so the entries of an older state are never hit again;
+        they are removed when the folder's next entry is written. Beyond 'max_bytes' the least recently used entries
+        are evicted. Like the CSV sidecars the cache is best effort: file errors make a miss. """
+    def __init__(self, directory=RESULT_CACHE_DIR, max_bytes=RESULT_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, fingerprint, kind, *request):
+        """ Entry name of a result of the data 'fingerprint'; 'request' holds everything else the result depends on """
+        digest = hashlib.sha1(json.dumps([__version__, kind, *request], default=str).encode('utf-8')).hexdigest()[:20]
+        return f'{fingerprint}_{kind}_{digest}'
+
+    def get(self, key):
+        """ The bytes stored under 'key', or None """
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        touch(path)
+        return data
+
+    def put(self, key, data):
+        path = os.path.join(self.directory, key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Written under a temporary name first, so a reader never sees a partial entry
+            temporary = f'{path}.{threading.get_ident()}.tmp'
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, path)
+            folder_key, state = key.split('_')[:2]
+            self.evict(stale=f'{folder_key}_', current=f'{folder_key}_{state}_')
+        except OSError:
+            pass
+
+    def evict(self, stale='', current=''):
+        """ Remove the entries starting with 'stale' but not 'current', then the least recently used ones beyond the limit """
+        if stale:
+            for name in os.listdir(self.directory):
+                if name.startswith(stale) and not name.startswith(current) and not name.endswith('.tmp'):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass  # removed by another job meanwhile
+        evict_lru(self.directory, self.max_bytes)
+
+# Rows of the statistics table: (label, column, setpoint column or None), in two groups separated by a ruler
+STATS_GROUPS = [
+    [
+        ('Temperature(°C)', 'Embryo Temp. Avg', 'Embryo Temp. Setpoint'),
+        ('CO2 conc.(%)', 'CO2 Concentration Avg', 'CO2 Setpoint'),
+        ('CO2 flow(l/h)', 'CO2 Flow Avg', None),
+        ('CO2 press.(bar)', 'CO2 Pressure Avg', None),
+        ('O2 conc.(%)', 'O2 Concentration Avg', 'O2 Setpoint'),
+        ('N2 flow(l/h)', 'N2 Flow Avg', None),
+        ('N2 press.(bar)', 'N2 Pressure Avg', None),
+    ],
+    [
+        ('Baseplate Temp.(°C)', 'Baseplate Temp.', None),
+        ('Incubator Board Temp.(°C)', 'Incubator Board Temp.', None),
+        ('Bottom Chamber Temp.(°C)', 'Bottom Chamber Temp.', None),
+        ('Backside Temp.(°C)', 'Backside Temp.', None),
+        ('Temp. Sensor A Avg(°C)', 'Temp. Sensor A Avg', None),
+        ('Temp. Sensor B Avg(°C)', 'Temp. Sensor B Avg', None),
+        ('Top Chamber Temp.(°C)', 'Top Chamber Temp.', None),
+        ('UV Light Voltage (mV)', 'UV Light Voltage [mV]', None),
+    ],
+]
+STATS_HEADERS = ['Sensor', 'MIN', 'MAX', 'AVG', 'Median', 'Std', 'SP']
+
+StatsRow = namedtuple('StatsRow', ['label', 'column', 'min', 'max', 'mean', 'median', 'std', 'sp'])
+
+class StatsResult:
+    """ Statistics of one timeframe, shared by the tabulate view and the exporters """
+    def __init__(self, start, end, samples, groups):
+        self.start = start
+        self.end = end
+        self.samples = samples  # number of log rows in the timeframe
+        self.groups = groups  # list of lists of StatsRow, same layout as STATS_GROUPS
+        self.events = None  # list of LogEvent of the timeframe, if they were detected
+
+    def rows(self):
+        return [row for group in self.groups for row in group]
+
+    def to_table(self):
+        # Both statistics groups with a separator; the SP column is left empty for sensors without a setpoint
+        separator = ['-----------------------------']
+        table = []
+        for i, group in enumerate(self.groups):
+            if i:
+                table.append(separator)
+            for row in group:
+                values = [row.label, row.min, row.max, row.mean, row.median, row.std]
+                table.append(values if row.sp is None else values + [row.sp])
+        return table
+
+    def to_text(self):
+        # The table format is set to "simple" and float numbers are formatted to 2 decimal places
+        return tabulate(self.to_table(), STATS_HEADERS, tablefmt="simple", numalign="decimal", floatfmt=".2f")
+
+    def to_records(self):
+        return [row._asdict() for row in self.rows()]
+
+    def to_json(self):
+        events = None if self.events is None else [[event.kind, event.label, str(event.start), str(event.end), event.peak]
+                                                   for event in self.events]
+        return json.dumps({'start': str(self.start), 'end': str(self.end), 'samples': self.samples,
+                           'groups': [[row._asdict() for row in group] for group in self.groups], 'events': events})
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        stats = cls(pd.Timestamp(data['start']), pd.Timestamp(data['end']), data['samples'],
+                    [[StatsRow(**row) for row in group] for group in data['groups']])
+        if data['events'] is not None:
+            stats.events = [LogEvent(kind, label, np.datetime64(start, 'ns'), np.datetime64(end, 'ns'), peak)
+                            for kind, label, start, end, peak in data['events']]
+        return stats
+
+class WindowAggregates:
+    """ Precomputed aggregates of the statistics columns for instant statistics over arbitrary windows
+        The rows are split into blocks; per block the sums, sums of squares, counts and value histograms are kept as
+        prefix sums and the block minima/maxima as sparse tables. A window query combines the full blocks in O(1)
+        (median: O(distinct values)) and scans at most two partial blocks at its edges. """
+    block_size = 4096
+    # Columns with more distinct 2-decimal values than this get an exact median scan instead of a histogram
+    max_distinct = 2048
+
+    def __init__(self, columns, names):
+        self.names = list(names)
+        k = len(self.names)
+        # Same values as the statistics table: float32 rounded to 2 decimals, in a buffer with spare capacity
+        self._values = np.empty((0, k), dtype=np.float32)
+        self.values = self._values
+        self.blocks = 0  # the tail after the last full block is always scanned
+        self.cum_count = np.zeros((1, k), dtype=np.int64)
+        self.cum_sum = np.zeros((1, k))
+        self.cum_sq = np.zeros((1, k))
+        # Sparse tables over the block minima/maxima: level j holds the extremes of 2**j consecutive blocks
+        self.min_table = [np.empty((0, k), dtype=np.float32)]
+        self.max_table = [np.empty((0, k), dtype=np.float32)]
+        # Prefix histograms over the distinct values of every column give exact medians
+        self.histograms = [(np.empty(0, dtype=np.float32), np.zeros((1, 0), dtype=np.int64))] * k
+        self.extend(columns)
+
+    def extend(self, columns):
+        """ Take the rows appended to 'columns' (live mode): only the new rows are rounded and only the blocks they
+            complete are added. The arrays only grow and the rows are published last, so queries running meanwhile
+            still see consistent aggregates of the rows they cover """
+        size = len(self.values)
+        # Cut to one length: a live store may grow while the aggregates are built
+        n = len(columns[self.names[0]])
+        if n <= size:
+            return
+        k = len(self.names)
+        if n > len(self._values):
+            # Grow geometrically; running queries keep the old buffer
+            buffer = np.empty((max(2 * len(self._values), n), k), dtype=np.float32)
+            buffer[:size] = self.values
+            self._values = buffer
+        new = self._values[size:n]
+        for j, name in enumerate(self.names):
+            new[:, j] = columns[name][size:n]
+        np.round(new, 2, out=new)
+        values = self._values[:n]
+
+        B = self.block_size
+        blocks = n // B
+        full = values[self.blocks * B:blocks * B].reshape(blocks - self.blocks, B, k)
+        valid = ~np.isnan(full)
+        if self.blocks == 0:
+            # Sums are taken relative to a per-column shift so the sums of squares keep their precision; it is taken
+            # from the first block, so it is fixed once that is complete (no prefix sums use it before)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                self.shift = np.nan_to_num(np.nanmax(values[:B], axis=0)).astype(np.float64)
+        shifted = np.where(valid, full - self.shift, 0.0)
+
+        histograms = []
+        for j, histogram in enumerate(self.histograms):
+            if histogram is None:
+                histograms.append(None)
+                continue
+            distinct, cum_counts = histogram
+            column = new[:, j]
+            added = np.setdiff1d(column[~np.isnan(column)], distinct)
+            if len(added):
+                merged = np.union1d(distinct, added)
+                if len(merged) > self.max_distinct:
+                    histograms.append(None)
+                    continue
+                # Values seen for the first time have no counts in the earlier blocks
+                remapped = np.zeros((len(cum_counts), len(merged)), dtype=cum_counts.dtype)
+                remapped[:, np.searchsorted(merged, distinct)] = cum_counts
+                distinct, cum_counts = merged, remapped
+            block_values = full[:, :, j]
+            block_ids = np.broadcast_to(np.arange(len(full))[:, None], block_values.shape)
+            mask = ~np.isnan(block_values)
+            flat = block_ids[mask] * len(distinct) + np.searchsorted(distinct, block_values[mask])
+            counts = np.bincount(flat, minlength=len(full) * len(distinct)).reshape(len(full), len(distinct))
+            histograms.append((distinct, self._prefix(counts, cum_counts)))
+
+        min_table = [np.concatenate((self.min_table[0], np.fmin.reduce(full, axis=1)))]
+        max_table = [np.concatenate((self.max_table[0], np.fmax.reduce(full, axis=1)))]
+        while 2 ** len(min_table) <= blocks:
+            level, half = len(min_table), 2 ** (len(min_table) - 1)
+            # Only the spans that end in the new blocks are added to the level
+            done = len(self.min_table[level]) if level < len(self.min_table) else 0
+            lower, upper = min_table[-1], max_table[-1]
+            min_table.append(np.concatenate((lower[:0] if done == 0 else self.min_table[level],
+                                             np.fmin(lower[done:-half], lower[done + half:]))))
+            max_table.append(np.concatenate((upper[:0] if done == 0 else self.max_table[level],
+                                             np.fmax(upper[done:-half], upper[done + half:]))))
+
+        self.histograms = histograms
+        self.min_table = min_table
+        self.max_table = max_table
+        self.cum_count = self._prefix(valid.sum(axis=1), self.cum_count)
+        self.cum_sum = self._prefix(shifted.sum(axis=1), self.cum_sum)
+        self.cum_sq = self._prefix((shifted * shifted).sum(axis=1), self.cum_sq)
+        self.blocks = blocks
+        self.values = values
+
+    @staticmethod
+    def _prefix(per_block, before):
+        # Continue the prefix sums 'before' over more blocks, summed in the same order as one cumsum over all blocks
+        return np.concatenate((before[:-1], np.cumsum(np.concatenate((before[-1:], per_block)), axis=0)))
+
+    def _table_query(self, table, reduce, lo, hi):
+        # Extremes of blocks lo..hi-1 from two overlapping power-of-two spans
+        level = (hi - lo).bit_length() - 1
+        return reduce(table[level][lo], table[level][hi - 2 ** level])
+
+    def covers(self, window):
+        """ True if the row slice lies within the rows the aggregates were built from (live rows are taken by extend) """
+        return window.stop <= len(self.values)
+
+    def query(self, window):
+        """ Return (mins, maxs, means, medians, stds) of every column over the row slice 'window' """
+        B = self.block_size
+        lo, hi = window.start, window.stop
+        first, last = -(-lo // B), hi // B  # full blocks first..last-1
+        if first >= last:
+            first = last = 0
+            edges = self.values[lo:hi]
+        else:
+            edges = np.concatenate((self.values[lo:first * B], self.values[last * B:hi]))
+        edge_valid = ~np.isnan(edges)
+        shift = self.shift  # replaced by extend until the first block is complete
+
+        count = edge_valid.sum(axis=0) + (self.cum_count[last] - self.cum_count[first])
+        shifted = np.where(edge_valid, edges - shift, 0.0)
+        total = shifted.sum(axis=0) + (self.cum_sum[last] - self.cum_sum[first])
+        squares = (shifted * shifted).sum(axis=0) + (self.cum_sq[last] - self.cum_sq[first])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = shift + total / count
+            stds = np.sqrt(np.maximum(squares - total * total / count, 0.0) / (count - 1))
+        stds[count < 2] = np.nan
+
+        mins = np.fmin.reduce(edges, axis=0) if len(edges) else np.full(len(self.names), np.nan, dtype=np.float32)
+        maxs = np.fmax.reduce(edges, axis=0) if len(edges) else np.full(len(self.names), np.nan, dtype=np.float32)
+        if last > first:
+            mins = np.fmin(mins, self._table_query(self.min_table, np.fmin, first, last))
+            maxs = np.fmax(maxs, self._table_query(self.max_table, np.fmax, first, last))
+
+        medians = np.full(len(self.names), np.nan, dtype=np.float32)
+        for j, histogram in enumerate(self.histograms):
+            if count[j] == 0:
+                continue
+            if histogram is None:
+                medians[j] = np.nanmedian(self.values[lo:hi, j])
+                continue
+            distinct, cum_counts = histogram
+            counts = cum_counts[last] - cum_counts[first]
+            counts += np.bincount(np.searchsorted(distinct, edges[edge_valid[:, j], j]), minlength=len(distinct))
+            medians[j] = histogram_median(distinct, counts)
+        return mins, maxs, means, medians, stds
+
+def histogram_median(distinct, counts):
+    """ Exact median of the values 'distinct' (sorted) occurring 'counts' times """
+    ranks = np.cumsum(counts)
+    # Middle value(s) of the sorted values; averaged in float32 like numpy's median
+    middle = distinct[np.searchsorted(ranks, [(ranks[-1] - 1) // 2, ranks[-1] // 2], side='right')]
+    return np.mean(middle)
+
+def stats_report(stats, instrument_nr):
+    """ Text of the statistics view: header lines, the statistics table and the detected events """
+    report = f"Incubation log statistics; {instrument_nr}\nSeleceted timeframe: {stats.start} - {stats.end}\n\n{stats.to_text()}"
+    if stats.events is not None:
+        report += f"\n\n\n{events_report(stats.events)}"
+    return report
+
+def compute_statistics(columns, window, start, end, groups=STATS_GROUPS, aggregates=None):
+    """ Compute min/max/mean/median/std of every sensor of 'groups' over the row slice 'window' (see TimeIndex.window)
+        'columns' maps a column name to an array (e.g. a LogStore); None is returned if the window holds no data
+        With matching precomputed 'aggregates' (WindowAggregates) the rows of the window are not rescanned """
+    samples = window.stop - window.start
+    if samples <= 0:
+        return None
+    specs = [spec for group in groups for spec in group]
+
+    if (aggregates is not None and aggregates.names == [column for label, column, sp_column in specs]
+            and aggregates.covers(window)):
+        mins, maxs, means, medians, stds = aggregates.query(window)
+    else:
+        # Gather the window of all sensor columns into one contiguous float32 block, rounded to 2 decimals like the table
+        block = np.empty((samples, len(specs)), dtype=np.float32)
+        for j, (label, column, sp_column) in enumerate(specs):
+            block[:, j] = columns[column][window]
+        np.round(block, 2, out=block)
+
+        # Every aggregate is one vectorized reduction over the whole block; sums are accumulated in float64
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns yield NaN
+            mins = np.nanmin(block, axis=0)
+            maxs = np.nanmax(block, axis=0)
+            means = np.nanmean(block, axis=0, dtype=np.float64)
+            medians = np.nanmedian(block, axis=0)
+            stds = np.nanstd(block, axis=0, dtype=np.float64, ddof=1)
+
+    # Setpoints are reported as the last value of the timeframe
+    last = window.stop - 1
+    rows = iter(StatsRow(label, column, float(mins[j]), float(maxs[j]), float(means[j]), float(medians[j]), float(stds[j]),
+                         None if sp_column is None else float(columns[sp_column][last]))
+                for j, (label, column, sp_column) in enumerate(specs))
+    return StatsResult(start, end, samples, [[next(rows) for _ in group] for group in groups])
+
+# Excursion checks: (label, sensor column, setpoint column, allowed deviation from the setpoint)
+EXCURSION_BANDS = [
+    ('Temperature(°C)', 'Embryo Temp. Avg', 'Embryo Temp. Setpoint', 0.3),
+    ('CO2 conc.(%)', 'CO2 Concentration Avg', 'CO2 Setpoint', 0.3),
+    ('O2 conc.(%)', 'O2 Concentration Avg', 'O2 Setpoint', 0.5),
+]
+# Sensors checked for rolling z-score outliers and flatlines: (label, column)
+ANOMALY_SENSORS = [
+    ('Temperature(°C)', 'Embryo Temp. Avg'),
+    ('CO2 conc.(%)', 'CO2 Concentration Avg'),
+    ('O2 conc.(%)', 'O2 Concentration Avg'),
+    ('Temp. Sensor A Avg(°C)', 'Temp. Sensor A Avg'),
+    ('Temp. Sensor B Avg(°C)', 'Temp. Sensor B Avg'),
+]
+# Limits of the event detection; windows and durations are in rows, i.e. minutes
+EVENT_LIMITS = {
+    'zscore': 5.0,  # distance from the rolling mean in rolling standard deviations
+    'zscore_window': 60,  # rows before a sample that give its rolling mean and standard deviation
+    'zscore_min_std': 0.01,  # the 2-decimal resolution; keeps a quiet signal from flagging every step
+    'drift': 0.3,  # rolling mean of |Sensor A - Sensor B| in °C
+    'drift_window': 30,
+    'flatline': 30,  # rows with an unchanged reading
+    'gap': np.timedelta64(2, 'm'),  # 'Time' steps of at least this length (the device writes a row per minute)
+}
+EVENTS_HEADERS = ['Event', 'Sensor', 'Start', 'End', 'Duration(min)', 'Peak']
+
+LogEvent = namedtuple('LogEvent', ['kind', 'label', 'start', 'end', 'peak'])
+
+def mask_runs(mask, min_length=1):
+    """ Run-length encode a boolean array: (starts, stops) row positions of its runs of True of min_length or more """
+    edges = np.diff(np.concatenate(([0], np.asarray(mask, dtype=np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    keep = stops - starts >= min_length
+    return starts[keep], stops[keep]
+
+def run_peaks(values, starts, stops):
+    """ Maximum of 'values' over every run starts[i]..stops[i]-1 """
+    if len(starts) == 0:
+        return np.empty(0, dtype=values.dtype)
+    # reduceat over (start, stop) pairs; the padding keeps a stop at the end of the array a valid index
+    return np.maximum.reduceat(np.append(values, 0), np.column_stack((starts, stops)).ravel())[::2]
+
+def rolling_mean_std(x, size):
+    """ Mean and standard deviation of the 'size' rows before every row from prefix sums (NaN rows are skipped)
+        The first 'size' rows have no full window and get NaN """
+    n = len(x)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n <= size:
+        return mean, std
+    valid = ~np.isnan(x)
+    # Sums relative to the first valid value keep the sums of squares precise
+    shift = x[valid][0] if valid.any() else 0.0
+    shifted = np.where(valid, x - shift, 0.0)
+    count, total, squares = (np.concatenate(([0], np.cumsum(a))) for a in (valid, shifted, shifted * shifted))
+    count, total, squares = (a[size:n] - a[:n - size] for a in (count, total, squares))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean[size:] = shift + total / count
+        std[size:] = np.sqrt(np.maximum(squares - total * total / count, 0.0) / (count - 1))
+    return mean, std
+
+def detect_events(columns, times, window, limits=EVENT_LIMITS, bands=EXCURSION_BANDS, sensors=ANOMALY_SENSORS):
+    """ Find setpoint excursions, rolling z-score outliers, Sensor A/B drift, flatlined sensors and gaps in 'Time'
+        within the row slice 'window'; every check is one vectorized pass, runs of flagged rows become one event
+        Returns a list of LogEvent sorted by start """
+    times = np.asarray(times[window], dtype='datetime64[ns]')
+    step = np.timedelta64(1, 'm')
+    events = []
+
+    def add_runs(kind, label, mask, peaks, min_length=1):
+        starts, stops = mask_runs(mask, min_length)
+        events.extend(LogEvent(kind, label, start, end, float(peak)) for start, end, peak in
+                      zip(times[starts], times[stops - 1] + step, run_peaks(peaks, starts, stops)))
+
+    # Excursions: the reading is outside the band around its setpoint
+    for label, column, sp_column, band in bands:
+        deviation = np.abs(columns[column][window] - columns[sp_column][window])
+        add_runs('Excursion', label, deviation > band, np.nan_to_num(deviation))
+
+    # The rolling windows reach back before the timeframe, so its first rows are checked too
+    context = min(window.start, limits['zscore_window'])
+    extended = slice(window.start - context, window.stop)
+    for label, column in sensors:
+        values = columns[column][extended].astype(np.float64)
+        mean, std = rolling_mean_std(values, limits['zscore_window'])
+        with np.errstate(invalid='ignore'):
+            zscore = np.abs(values - mean) / np.maximum(std, limits['zscore_min_std'])
+        zscore = np.nan_to_num(zscore[context:])
+        add_runs('Outlier', label, zscore > limits['zscore'], zscore)
+        # Flatline: the same reading (no step between consecutive rows) for at least the limit
+        values = values[context:]
+        unchanged = np.concatenate(([False], values[1:] == values[:-1]))
+        starts, stops = mask_runs(unchanged, limits['flatline'] - 1)
+        events.extend(LogEvent('Flatline', label, times[start - 1], times[stop - 1] + step, float(values[start]))
+                      for start, stop in zip(starts, stops))
+
+    # A/B drift: the two chamber sensors disagree on average over the rolling window
+    difference = np.abs(columns['Temp. Sensor A Avg'][extended].astype(np.float64) - columns['Temp. Sensor B Avg'][extended])
+    context_drift = min(context, limits['drift_window'])
+    drift, _ = rolling_mean_std(difference[context - context_drift:], limits['drift_window'])
+    drift = np.nan_to_num(drift[context_drift:])
+    add_runs('A/B drift', 'Temp. Sensor A/B(°C)', drift > limits['drift'], drift)
+
+    # Gaps: consecutive rows further apart than the limit
+    gaps = np.flatnonzero(np.diff(times) >= limits['gap'])
+    events.extend(LogEvent('Gap', 'Time', times[i], times[i + 1], None) for i in gaps)
+    return sorted(events, key=lambda event: event.start)
+
+def update_events(columns, times, window, events, stop, limits=EVENT_LIMITS, bands=EXCURSION_BANDS,
+                  sensors=ANOMALY_SENSORS):
+    """ Events of the row slice 'window' from the 'events' already detected over its rows window.start..stop-1, for
+        live mode: only the rows from where a run may still grow (the last flatline limit of rows, moved back to the
+        start of every event reaching into them) are checked again; the events before are kept """
+    resume = max(window.start, stop - limits['flatline'])
+    starts = np.searchsorted(times, np.array([event.start for event in events], dtype='datetime64[ns]'))
+    ends = np.array([event.end for event in events], dtype='datetime64[ns]')
+    while True:
+        reaching = starts[(starts < resume) & (ends > times[resume])]
+        if not len(reaching):
+            break
+        resume = int(reaching.min())
+    kept = [event for event, start in zip(events, starts) if start < resume]
+    return kept + detect_events(columns, times, slice(resume, window.stop), limits, bands, sensors)
+
+def events_report(events, limit=50):
+    """ Text of the detected events: a count per kind and a table of the first 'limit' events """
+    if not events:
+        return "Events: none detected."
+    kinds = {}
+    for event in events:
+        kinds[event.kind] = kinds.get(event.kind, 0) + 1
+    summary = "Events: " + ", ".join(f"{kind} {count}" for kind, count in kinds.items())
+    table = [[event.kind, event.label, f"{pd.Timestamp(event.start):%Y-%m-%d %H:%M}", f"{pd.Timestamp(event.end):%Y-%m-%d %H:%M}",
+              int((event.end - event.start) // np.timedelta64(1, 'm')), event.peak] for event in events[:limit]]
+    text = f"{summary}\n\n" + tabulate(table, EVENTS_HEADERS, tablefmt="simple", floatfmt=".2f", missingval='')
+    if len(events) > limit:
+        text += f"\n... and {len(events) - limit} more"
+    return text
+
+def statistics_job(store, filter_start, filter_end, aggregates=None, cache=None, instrument_nr='', previous=None,
+                   progress=None, is_cancelled=None):
+    """ Background job: statistics and events of the selected timeframe, from the ResultCache 'cache' when they were
+        computed before for the same files; the events of 'previous' statistics with the same start (the timeframe
+        before live rows were appended) are updated instead of detected again """
+    key = None
+    if cache is not None and store.fingerprint is not None:
+        key = cache.key(store.fingerprint, 'stats', instrument_nr, filter_start, filter_end, STATS_GROUPS, EVENT_LIMITS,
+                        EXCURSION_BANDS, ANOMALY_SENSORS)
+        with stage('result cache'):
+            data = cache.get(key)
+            if data is not None:
+                return StatsResult.from_json(data.decode('utf-8'))
+    with stage('window lookup'):
+        window = store.time_index.window(filter_start, filter_end)
+    with stage('statistics'):
+        stats = compute_statistics(store, window, filter_start, filter_end, aggregates=aggregates)
+    if stats is not None:
+        with stage('event detection'):
+            if (previous is not None and previous.events is not None and previous.start == filter_start
+                    and 0 < previous.samples <= stats.samples):
+                stats.events = update_events(store, store['Time'], window, previous.events,
+                                             window.start + previous.samples)
+            else:
+                stats.events = detect_events(store, store['Time'], window)
+        if key is not None:
+            cache.put(key, stats.to_json().encode('utf-8'))
+    return stats
+
+class RunningStats:
+    """ Statistics of one timeframe accumulated chunk by chunk, for streaming mode
+        Counts, shifted sums and sums of squares, min/max and per-column value histograms (exact medians of the
+        2-decimal values) are updated per chunk, so memory does not grow with the number of rows. """
+    def __init__(self, start, end, groups=STATS_GROUPS):
+        self.start = start
+        self.end = end
+        self.groups = groups
+        self.specs = [spec for group in groups for spec in group]
+        k = len(self.specs)
+        self.samples = 0
+        self.count = np.zeros(k, dtype=np.int64)
+        self.shift = None
+        self.total = np.zeros(k)
+        self.squares = np.zeros(k)
+        self.mins = np.full(k, np.nan, dtype=np.float32)
+        self.maxs = np.full(k, np.nan, dtype=np.float32)
+        self.histograms = [(np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)) for _ in range(k)]
+        self.setpoints = {}
+
+    def update(self, chunk):
+        """ Add the rows of a time-sorted chunk that fall into the timeframe """
+        times = chunk['Time'].to_numpy()
+        window = slice(int(np.searchsorted(times, np.datetime64(self.start, 'ns'), side='left')),
+                       int(np.searchsorted(times, np.datetime64(self.end, 'ns'), side='right')))
+        rows = window.stop - window.start
+        if rows <= 0:
+            return
+        block = np.empty((rows, len(self.specs)), dtype=np.float32)
+        for j, (label, column, sp_column) in enumerate(self.specs):
+            block[:, j] = chunk[column].to_numpy()[window]
+            if sp_column is not None:
+                self.setpoints[sp_column] = float(chunk[sp_column].to_numpy()[window.stop - 1])
+        np.round(block, 2, out=block)
+        valid = ~np.isnan(block)
+        if self.shift is None:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                self.shift = np.nan_to_num(np.nanmax(block, axis=0)).astype(np.float64)
+        shifted = np.where(valid, block - self.shift, 0.0)
+        self.samples += rows
+        self.count += valid.sum(axis=0)
+        self.total += shifted.sum(axis=0)
+        self.squares += (shifted * shifted).sum(axis=0)
+        self.mins = np.fmin(self.mins, np.fmin.reduce(block, axis=0))
+        self.maxs = np.fmax(self.maxs, np.fmax.reduce(block, axis=0))
+        for j in range(len(self.specs)):
+            # Merge the chunk's value counts into the running histogram
+            distinct, counts = np.unique(block[valid[:, j], j], return_counts=True)
+            old_distinct, old_counts = self.histograms[j]
+            merged = np.union1d(old_distinct, distinct)
+            merged_counts = np.zeros(len(merged), dtype=np.int64)
+            merged_counts[np.searchsorted(merged, old_distinct)] += old_counts
+            merged_counts[np.searchsorted(merged, distinct)] += counts
+            self.histograms[j] = (merged, merged_counts)
+
+    def result(self):
+        """ StatsResult of the rows seen so far; None if the timeframe holds no data """
+        if self.samples == 0:
+            return None
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = self.shift + self.total / self.count
+            stds = np.sqrt(np.maximum(self.squares - self.total * self.total / self.count, 0.0) / (self.count - 1))
+        stds[self.count < 2] = np.nan
+        rows = iter(StatsRow(label, column, float(self.mins[j]), float(self.maxs[j]), float(means[j]),
+                             float(histogram_median(*self.histograms[j])) if self.count[j] else float('nan'), float(stds[j]),
+                             None if sp_column is None else self.setpoints.get(sp_column))
+                    for j, (label, column, sp_column) in enumerate(self.specs))
+        return StatsResult(self.start, self.end, self.samples, [[next(rows) for _ in group] for group in self.groups])
+
+def stream_statistics(folder, windows, chunksize=STREAM_CHUNKSIZE, progress=None, is_cancelled=None):
+    """ Statistics of several timeframes in one streaming pass over a log folder, without loading it whole
+        Returns (list of StatsResult or None per timeframe, (first, last) 'Time' of the rows read) """
+    accumulators = [RunningStats(start, end) for start, end in windows]
+    last_end = max(end for start, end in windows)
+    first_time = last_time = None
+    for chunk in stream_log_folder(folder, chunksize, is_cancelled=is_cancelled):
+        for accumulator in accumulators:
+            accumulator.update(chunk)
+        if first_time is None:
+            first_time = chunk['Time'].iloc[0]
+        last_time = chunk['Time'].iloc[-1]
+        if progress is not None:
+            progress(0, 0, f"Streaming statistics: {last_time:%Y-%m-%d %H:%M}")
+        # The stream is time-ordered, so nothing after the last timeframe is needed
+        if last_time > last_end:
+            break
+    return [accumulator.result() for accumulator in accumulators], (first_time, last_time)
+
+def scan_log_range(folder, chunksize=STREAM_CHUNKSIZE, progress=None, is_cancelled=None):
+    """ Background job: (first, last) 'Time' of a log folder, reading only the 'Time' column in chunks """
+    first_time = last_time = None
+    for chunk in stream_log_folder(folder, chunksize, usecols=['Time'], is_cancelled=is_cancelled):
+        if first_time is None:
+            first_time = chunk['Time'].iloc[0]
+        last_time = chunk['Time'].iloc[-1]
+    return first_time, last_time
+
+def aggregates_job(store, progress=None, is_cancelled=None):
+    """ Background job: build the WindowAggregates of the statistics table columns """
+    names = [column for group in STATS_GROUPS for label, column, sp_column in group]
+    return WindowAggregates(store, names)
+
+def prepare_chart_data(store, rollups=None, cache=None, instrument_nr='', progress=None, is_cancelled=None):
+    """ Background job: compute the chart date range and the merged event intervals of every marker type
+        With the store's RollupPyramid, long ranges are drawn from its buckets. With a ResultCache, the figure state
+        of the same chart drawn earlier (see figure_state) is looked up as well. """
+    # Define the chart range based on the data; the bounds of the time index
+    chart_range_min = store.time_index.start.strftime('%Y-%m-%d %H:%M')
+    chart_range_max = store.time_index.end.strftime('%Y-%m-%d %H:%M')
+    times = store.time_index.times
+    with stage('event intervals'):
+        intervals = {flag: event_intervals(times, store.flag(flag)) for flag in EVENT_FLAGS}
+    chart_data = {'store': store, 'range': (chart_range_min, chart_range_max), 'intervals': intervals, 'rollups': rollups,
+                  'figure': None, 'cache_key': None}
+    if cache is not None and store.fingerprint is not None:
+        chart_data['cache_key'] = cache.key(store.fingerprint, 'figure', instrument_nr, CHART_FIGSIZE, matplotlib.__version__)
+        with stage('result cache'):
+            chart_data['figure'] = cache.get(chart_data['cache_key'])
+    return chart_data
+
+# Size (inches) of the incubation charts
+CHART_FIGSIZE = (12, 8)
+
+def chart_title(instrument_nr, chart_range_min, chart_range_max):
+    return f'Incubation data; instrument nr. {instrument_nr}; From {chart_range_min} to {chart_range_max}'
+
+def draw_chart_figure(fig, chart_data, instrument_nr):
+    """ Draw the incubation charts of 'chart_data' (see prepare_chart_data) on 'fig'; shared by the GUI and batch mode """
+    store = chart_data['store']
+    times = store['Time']
+    chart_range_min, chart_range_max = chart_data['range']
+    # Specify the number of rows and columns for subplots
+    axes = fig.subplots(nrows=3, ncols=1, sharex=True, gridspec_kw={'height_ratios': [1, 2, 2]})
+    # Series are drawn decimated to the pixel width and re-detailed on zoom; keep the decimator alive with the figure
+    decimator = ChartDecimator(times, chart_data.get('rollups'))
+    fig.decimator = decimator
+    fig.canvas.mpl_connect('resize_event', decimator.on_resize)
+    
+    # Number format of the Y-axis ticks; a format string (not a function) keeps the figure picklable
+    y_axis_formatter = ticker.StrMethodFormatter('{x:.1f}')
+
+    # Plot 1 Temperature (Embryo Temp. Avg; + SP):
+    decimator.plot(axes[0], store['Embryo Temp. Setpoint'], label='Embryo Temp. Setpoint', color='#4a4a4a', linewidth=0.75, linestyle='dashed')
+    decimator.plot(axes[0], store['Embryo Temp. Avg'], label='Embryo Temp. Avg', color='#3232a8', linewidth=0.75)
+    axes[0].set_ylabel('Temp.°C')
+    axes[0].set_title(chart_title(instrument_nr, chart_range_min, chart_range_max))
+    axes[0].tick_params(axis='y', labelsize=7)  # Change the tick font size on the left Y-axis
+    
+
+    # Plot 2: CO2 SP, CO2 conc.; CO2 Flow
+    decimator.plot(axes[1], store['CO2 Setpoint'], label='CO2 Setpoint', color='#4a4a4a', linewidth=0.75, linestyle='dashed')
+    decimator.plot(axes[1], store['CO2 Concentration Avg'], label='CO2 Concentration Avg', color='#3232a8', linewidth=0.75)
+    decimator.plot(axes[1], store['CO2 Flow Avg'], label='CO2 Flow Avg', color='#73f707', linewidth=0.75)
+    axes[1].set_ylabel('Co2 conc.(%) / Flow(l/h)')        
+    axes[1].tick_params(axis='y', labelsize=7)  # Change the tick font size on the left Y-axis
+    axes[1].yaxis.set_major_formatter(y_axis_formatter)  # Set the number format for the left Y-axis
+    
+    #### Apply top-padding on the left Y-axis as a percentage of the chart height
+    # if the highest value of CO2 flow is higher than CO2 conc.: apply padding based on CO2 flow
+    # if the highest value of CO2 conc. is higher than CO2 flow: apply padding based on CO2 conc.
+    if np.nanmax(store['CO2 Concentration Avg']) > np.nanmax(store['CO2 Flow Avg']):
+        co2_scale_max = np.nanmax(store['CO2 Concentration Avg'])
+    else:
+        co2_scale_max = np.nanmax(store['CO2 Flow Avg'])
+    axes[1].set_ylim(top=(co2_scale_max * 1.3)) # add 30% padding on top of the highest value
+
+    # Create a secondary y-axis for CO2 Pressure
+    axes_secy1 = axes[1].twinx()
+    decimator.plot(axes_secy1, store['CO2 Pressure Avg'], label='CO2 Pressure Avg', color='#eb34d8', linewidth=0.75)
+    axes_secy1.set_ylabel('Co2 Pressure (bar)')
+    # Set the y-axis limits with some padding below zero to elevate scale and separate from conc and flow.
+    axes_secy1.set_ylim(-1.5, 0.9)  
+    # Define custom tick positions for CO2 Pressure
+    axes_secy1.set_yticks([0.0, 0.2, 0.4, 0.6, 0.8])  # Adjust values based on data range
+    axes_secy1.tick_params(axis='y', labelsize=7)
+    
+    
+
+    # Plot 3: O2 SP; O2 conc.; N2 Flow
+    decimator.plot(axes[2], store['O2 Setpoint'], label='O2 Setpoint', color='#4a4a4a', linewidth=0.75, linestyle='dashed')
+    decimator.plot(axes[2], store['O2 Concentration Avg'], label='O2 Concentration Avg', color='#3232a8', linewidth=0.75)
+    decimator.plot(axes[2], store['N2 Flow Avg'], label='N2 Flow Avg', color='#73f707', linewidth=0.75)
+    axes[2].set_ylabel('O2 conc.(%) / N2 Flow(l/h)')        
+    axes[2].tick_params(axis='y', labelsize=7)  # Change the tick font size on the left Y-axis
+    axes[2].yaxis.set_major_formatter(y_axis_formatter)  # Set the number format for the left Y-axis
+    
+    #### Apply top-padding on the left Y-axis as a percentage of the chart height
+    # if the highest value of N2 flow is higher than O2 conc.: apply padding based on N2 flow
+    # if the highest value of O2 conc. is higher than N2 flow: apply padding based on O2 conc.
+    if np.nanmax(store['O2 Concentration Avg']) > np.nanmax(store['N2 Flow Avg']):
+        O2_scale_max = np.nanmax(store['O2 Concentration Avg'])
+    else:
+        O2_scale_max = np.nanmax(store['N2 Flow Avg'])        
+    axes[2].set_ylim(top=(O2_scale_max * 1.3)) # add 30% padding on top of the highest value
+
+   
+    # Create a secondary y-axis for N2 Pressure
+    axes_secy2 = axes[2].twinx()
+    decimator.plot(axes_secy2, store['N2 Pressure Avg'], label='N2 Pressure Avg', color='#eb34d8', linewidth=0.75)
+    axes_secy2.set_ylabel('N2 Pressure (bar)')
+    # Set the y-axis limits with some padding below zero to elevate scale and separate from conc and flow.
+    axes_secy2.set_ylim(-1.5, 0.9)  
+    # Define custom tick positions for N2 Pressure
+    axes_secy2.set_yticks([0.0, 0.2, 0.4, 0.6, 0.8])   # Adjust values based on data range
+    axes_secy2.tick_params(axis='y', labelsize=7)
+    
+
+    # Add event markings for door_open, temp_alarm, co2_alarm, and o2_alarm:
+    # consecutive flagged minutes are merged into intervals and every marker type is drawn as one collection per axis
+    with stage('event markers'):
+        draw_event_markers(axes, chart_data['intervals'])
+
+    # Create custom legend entries for the vertical lines
+    custom_lines = [
+        mlines.Line2D([0], [0], color='black', linestyle='-.', linewidth=0.75, label='Door opening'),
+        mlines.Line2D([0], [0], color='red', linestyle='dotted', linewidth=0.75, label='Sensor alarm'),
+        mlines.Line2D([0], [0], color='#4a4a4a', linestyle='dashed', linewidth=0.75, label='Set point'),
+        mlines.Line2D([0], [0], color='#3232a8', linestyle='solid', linewidth=0.75, label='Conc.\nTemp.'),
+        mlines.Line2D([0], [0], color='#73f707', linestyle='solid', linewidth=0.75, label='Flow'),
+        mlines.Line2D([0], [0], color='#eb34d8', linestyle='solid', linewidth=0.75, label='Pressure')
+               ]
+    # Add the custom legend to the figure
+    fig.legend(handles=custom_lines, fontsize='7', loc='upper right')
+
+    # Adjust the spacing between subplots
+    with stage('layout'):
+        fig.tight_layout()
+    
+    # Set the locator
+    locator = mdates.AutoDateLocator(minticks=10, maxticks=50)
+    formatter = mdates.ConciseDateFormatter(locator)
+    axes[2].xaxis.set_major_locator(locator)
+    axes[2].xaxis.set_major_formatter(formatter)
+    axes[2].set_xlabel('Date / time')
+
+    # Customize the tick font size on the X-axis for all subplots
+    for ax in axes:
+        ax.tick_params(axis='x', labelsize=8)  # Change the tick font size on the X-axis
+
+    fig.chart_axes = axes
+    return axes
+
+def zoom_chart_figure(axes, store, instrument_nr, start, end):
+    """ Zoom the charts drawn by draw_chart_figure to the timeframe start..end: x range, title and y-limits with the
+        padding of draw_chart_figure taken over the rows of the timeframe """
+    # The decimator re-renders the zoomed range at full resolution
+    axes[0].set_xlim(mdates.date2num(np.datetime64(start)), mdates.date2num(np.datetime64(end)))
+    axes[0].set_title(chart_title(instrument_nr, pd.Timestamp(start).strftime('%Y-%m-%d %H:%M'),
+                                  pd.Timestamp(end).strftime('%Y-%m-%d %H:%M')))
+    rows = store.time_index.window(start, end)
+    plotted = [(axes[0], ['Embryo Temp. Setpoint', 'Embryo Temp. Avg'], None),
+               (axes[1], ['CO2 Setpoint', 'CO2 Concentration Avg', 'CO2 Flow Avg'], ['CO2 Concentration Avg', 'CO2 Flow Avg']),
+               (axes[2], ['O2 Setpoint', 'O2 Concentration Avg', 'N2 Flow Avg'], ['O2 Concentration Avg', 'N2 Flow Avg'])]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns in the timeframe
+        for ax, columns, padded in plotted:
+            low = np.nanmin([np.nanmin(store[column][rows]) for column in columns])
+            high = np.nanmax([np.nanmax(store[column][rows]) for column in columns])
+            if not (np.isfinite(low) and np.isfinite(high)):
+                continue
+            # The default margins of matplotlib, or 30% padding on top of the highest value like the overview
+            margin = (high - low) * ax.margins()[1] or 0.5
+            top = np.nanmax([np.nanmax(store[column][rows]) for column in padded]) * 1.3 if padded else high + margin
+            ax.set_ylim(low - margin, top if np.isfinite(top) and top > low else high + margin)
+
+def figure_state(fig):
+    """ A figure drawn by draw_chart_figure pickled without its decimator (that holds the store) """
+    decimator, fig.decimator = fig.decimator, None
+    try:
+        return pickle.dumps(fig)
+    finally:
+        fig.decimator = decimator
+
+def restore_chart_figure(data, store, rollups=None):
+    """ The figure of figure_state with a new ChartDecimator on the store (its lines are labelled with their column)
+        Returns None if the state cannot be restored. """
+    try:
+        fig = pickle.loads(data)
+    except Exception:
+        return None
+    decimator = ChartDecimator(store['Time'], rollups)
+    for ax in fig.axes:
+        for line in ax.lines:
+            decimator.adopt(line, store[line.get_label()])
+    fig.decimator = decimator
+    fig.canvas.mpl_connect('resize_event', decimator.on_resize)
+    return fig
+
+def extend_chart_figure(fig, store, first_row, instrument_nr):
+    """ Add the rows first_row.. of a grown store (live mode) to a figure drawn by draw_chart_figure """
+    times = store['Time']
+    # Only the new rows are scanned for events; they are added to the marker collections of the figure
+    for ax, flag, style in event_markers(fig.chart_axes):
+        extend_event_markers(ax, event_intervals(times[first_row:], store.flag(flag)[first_row:]), flag=flag, **style)
+    fig.chart_axes[0].set_title(chart_title(instrument_nr, store.time_index.start.strftime('%Y-%m-%d %H:%M'),
+                                            store.time_index.end.strftime('%Y-%m-%d %H:%M')))
+    fig.decimator.extend(store)
+    fig.canvas.draw_idle()
+
+class FleetStore:
+    """ LogStores of several instruments keyed by instrument nr., at most 'max_instruments' of them resident
+        Adding an instrument beyond the limit evicts the least recently used one. """
+    def __init__(self, max_instruments=8):
+        self.max_instruments = max_instruments
+        self.stores = OrderedDict()  # instrument nr. -> LogStore, least recently used first
+
+    def __contains__(self, instrument_nr):
+        return instrument_nr in self.stores
+
+    def __len__(self):
+        return len(self.stores)
+
+    def is_current(self, instrument_nr, folder):
+        """ True if the instrument is resident and was loaded from the current state of 'folder' """
+        store = self.stores.get(instrument_nr)
+        return store is not None and store.fingerprint == folder_fingerprint(folder)
+
+    def add(self, instrument_nr, store, keep=()):
+        # Instruments in 'keep' (e.g. the ones being compared) are not evicted
+        self.stores[instrument_nr] = store
+        self.stores.move_to_end(instrument_nr)
+        for evicted in [nr for nr in self.stores if nr not in keep][:max(len(self.stores) - self.max_instruments, 0)]:
+            del self.stores[evicted]
+
+    def select(self, instruments):
+        """ {instrument nr.: LogStore} of the resident 'instruments' in their order; marks them as recently used """
+        selected = {}
+        for nr in instruments:
+            if nr in self.stores:
+                self.stores.move_to_end(nr)
+                selected[nr] = self.stores[nr]
+        return selected
+
+    def memory_usage(self):
+        return sum(store.memory_usage() for store in self.stores.values())
+
+def load_fleet(folders, max_workers=None, progress=None, is_cancelled=None):
+    """ Background job: load the (instrument nr., folder) pairs concurrently; returns {instrument nr.: LogStore} """
+    stores = {}
+    # Every folder load parses its files on the shared pool of load_log_folder as well
+    with ThreadPoolExecutor(max_workers=max_workers or min(4, len(folders))) as executor:
+        futures = {executor.submit(with_recorder(load_log_data), folder, is_cancelled=is_cancelled): nr
+                   for nr, folder in folders}
+        for done, future in enumerate(as_completed(futures), 1):
+            nr = futures[future]
+            try:
+                stores[nr] = future.result()
+            except JobCancelled:
+                raise
+            except Exception as e:
+                raise RuntimeError(f"{nr}: {e}") from e
+            if progress is not None:
+                progress(done, len(folders), f"Loaded {nr}")
+    return stores
+
+def fleet_statistics(stores, start, end, groups=STATS_GROUPS):
+    """ Statistics of the timeframe start..end for every instrument of 'stores' ({instrument nr.: LogStore}) as
+        {instrument nr.: StatsResult or None}, from one groupby over the windows of all instruments """
+    specs = [spec for group in groups for spec in group]
+    names = [column for label, column, sp_column in specs]
+    windows = {nr: store.time_index.window(start, end) for nr, store in stores.items()}
+    frames = []
+    for nr, store in stores.items():
+        window = windows[nr]
+        if window.stop > window.start:
+            # Rounded to 2 decimals in float32 like the statistics table of a single instrument
+            frame = pd.DataFrame({name: np.round(store[name][window], 2) for name in names})
+            frame['Instrument'] = nr
+            frames.append(frame)
+    results = dict.fromkeys(stores)
+    if not frames:
+        return results
+
+    with stage('groupby'):
+        grouped = pd.concat(frames, ignore_index=True).groupby('Instrument', sort=False)
+        aggregated = grouped[names].agg(['min', 'max', 'mean', 'median', 'std'])
+    for nr, values in aggregated.iterrows():
+        store, window = stores[nr], windows[nr]
+        # Setpoints are reported as the last value of the timeframe
+        last = window.stop - 1
+        rows = iter(StatsRow(label, column, *(float(values[(column, f)]) for f in ('min', 'max', 'mean', 'median', 'std')),
+                             None if sp_column is None else float(store[sp_column][last]))
+                    for label, column, sp_column in specs)
+        results[nr] = StatsResult(start, end, window.stop - window.start, [[next(rows) for _ in group] for group in groups])
+    return results
+
+def fleet_statistics_job(stores, start, end, progress=None, is_cancelled=None):
+    """ Background job: fleet_statistics of the resident instruments """
+    return fleet_statistics(stores, start, end)
+
+def fleet_report(results, start, end):
+    """ Text of the fleet statistics: per sensor one row per instrument, in the layout of the statistics table """
+    separator = ['-----------------------------']
+    table = []
+    for gi, group in enumerate(STATS_GROUPS):
+        if gi:
+            table.append(separator)
+        for ri, (label, column, sp_column) in enumerate(group):
+            for k, (nr, stats) in enumerate(results.items()):
+                values = [label if k == 0 else '', nr]
+                if stats is None:
+                    table.append(values + ['no data'])
+                    continue
+                row = stats.groups[gi][ri]
+                values += [row.min, row.max, row.mean, row.median, row.std]
+                table.append(values if row.sp is None else values + [row.sp])
+    text = tabulate(table, ['Sensor', 'Instrument'] + STATS_HEADERS[1:], tablefmt="simple", numalign="decimal",
+                    floatfmt=".2f")
+    samples = ", ".join(f"{nr}: {stats.samples if stats is not None else 0}" for nr, stats in results.items())
+    return f"Fleet statistics; {len(results)} instruments\nSelected timeframe: {start} - {end}\nRows: {samples}\n\n{text}"
+
+def draw_fleet_figure(fig, stores, spec, start, end):
+    """ Draw one sensor ('spec' is a STATS_GROUPS row) of every instrument of 'stores' over start..end as small
+        multiples with shared axes; door openings are marked like on the incubation charts """
+    label, column, sp_column = spec
+    ncols = 2 if len(stores) > 3 else 1
+    nrows = -(-len(stores) // ncols)
+    axes = fig.subplots(nrows=nrows, ncols=ncols, sharex=True, sharey=True, squeeze=False).ravel()
+    # One decimator per instrument (their time axes differ); kept alive with the figure
+    fig.decimators = []
+    for ax, (nr, store) in zip(axes, stores.items()):
+        window = store.time_index.window(start, end)
+        decimator = ChartDecimator(store['Time'][window])
+        if sp_column is not None:
+            decimator.plot(ax, store[sp_column][window], label=sp_column, color='#4a4a4a', linewidth=0.75, linestyle='dashed')
+        decimator.plot(ax, store[column][window], label=column, color='#3232a8', linewidth=0.75)
+        add_event_markers(ax, event_intervals(store['Time'][window], store.flag('door_open')[window]),
+                          color='black', linestyle='-.', ymin=0.00, ymax=0.04)
+        ax.set_title(nr, fontsize=8)
+        ax.tick_params(axis='both', labelsize=7)
+        fig.canvas.mpl_connect('resize_event', decimator.on_resize)
+        fig.decimators.append(decimator)
+    for ax in axes[len(stores):]:
+        ax.set_visible(False)
+    fig.suptitle(f'{label}; From {start:%Y-%m-%d %H:%M} to {end:%Y-%m-%d %H:%M}')
+
+    locator = mdates.AutoDateLocator(minticks=4, maxticks=12)
+    axes[0].xaxis.set_major_locator(locator)
+    axes[0].xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    axes[0].set_xlim(mdates.date2num(np.datetime64(start, 'ns')), mdates.date2num(np.datetime64(end, 'ns')))
+    with stage('layout'):
+        fig.tight_layout()
+    return axes
+
+class WorkerSignals(QObject):
+    """ Signals of a background Worker; they are delivered to the GUI thread through queued connections """
+    progress = Signal(int, int, str)  # done, total (0 = busy indicator), message
+    result = Signal(object)
+    error = Signal(str)
+    finished = Signal()
+
+class Worker(QRunnable):
+    """ Run 'fn(*args, progress=..., is_cancelled=...)' on a QThreadPool and report back through WorkerSignals """
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+        self.cancelled = threading.Event()
+        self.recorder = None  # StageRecorder of this run, if it is recorded
+        self.failed = False
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            with bind_recorder(self.recorder):
+                result = self.fn(*self.args, progress=self.signals.progress.emit, is_cancelled=self.cancelled.is_set)
+        except JobCancelled:
+            pass
+        except Exception as e:
+            self.failed = True
+            if not self.cancelled.is_set():
+                self.signals.error.emit(str(e))
+        else:
+            if not self.cancelled.is_set():
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+class FastChartView(QWidget):
+    """ The incubation charts embedded in the main window, drawn with pyqtgraph
+        The plots share the x-axis and every curve is clipped to the view and downsampled to its pixel width by
+        pyqtgraph ('peak' keeps the spikes), so panning and zooming months of minute data stays fluid. Door openings
+        and alarms are one bar item per marker type on an overlay. Export draws the visible range with matplotlib. """
+    # Per plot like draw_chart_figure: left axis label, (column, color, dashed) series, right axis (label, column), alarm
+    PLOTS = [
+        ('Temp.°C', [('Embryo Temp. Setpoint', '#4a4a4a', True), ('Embryo Temp. Avg', '#3232a8', False)],
+         None, 'temp_alarm'),
+        ('Co2 conc.(%) / Flow(l/h)', [('CO2 Setpoint', '#4a4a4a', True), ('CO2 Concentration Avg', '#3232a8', False),
+                                      ('CO2 Flow Avg', '#73f707', False)],
+         ('Co2 Pressure (bar)', 'CO2 Pressure Avg'), 'co2_alarm'),
+        ('O2 conc.(%) / N2 Flow(l/h)', [('O2 Setpoint', '#4a4a4a', True), ('O2 Concentration Avg', '#3232a8', False),
+                                        ('N2 Flow Avg', '#73f707', False)],
+         ('N2 Pressure (bar)', 'N2 Pressure Avg'), 'o2_alarm'),
+    ]
+
+    def __init__(self):
+        super().__init__()
+        pg.setConfigOptions(background='w', foreground='k')
+        self.store = None
+        self.rollups = None
+        self.instrument_nr = ''
+        self.x = None  # 'Time' as Unix seconds
+        self.curves = []  # (PlotDataItem, column)
+        self.plots = []
+        self.marker_views = []  # (ViewBox, alarm flag) per plot
+        self.marker_items = {}  # (plot row, flag) -> BarGraphItem
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        header = QHBoxLayout()
+        self.title_label = QLabel()
+        export_button = QPushButton('Export (matplotlib)')
+        export_button.clicked.connect(self.export)
+        header.addWidget(self.title_label, 1)
+        header.addWidget(export_button)
+        layout.addLayout(header)
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setMinimumHeight(450)
+        layout.addWidget(self.graphics)
+
+        for row, (ylabel, series, secondary, alarm) in enumerate(self.PLOTS):
+            # The log times are local times, shown as they are
+            plot = self.graphics.addPlot(row=row, col=0, axisItems={'bottom': pg.DateAxisItem(utcOffset=0)})
+            plot.setLabel('left', ylabel)
+            # Axes of one width on both sides, so the linked plots show the same time range
+            plot.showAxis('right')
+            plot.getAxis('right').setStyle(showValues=secondary is not None)
+            plot.getAxis('left').setWidth(60)
+            plot.getAxis('right').setWidth(60)
+            plot.setClipToView(True)
+            plot.setDownsampling(auto=True, mode='peak')
+            if self.plots:
+                plot.setXLink(self.plots[0])
+            for column, color, dashed in series:
+                pen = pg.mkPen(color, style=Qt.DashLine if dashed else Qt.SolidLine)
+                self.curves.append((plot.plot(pen=pen, connect='finite'), column))
+            if secondary is not None:
+                label, column = secondary
+                # Same fixed range as the matplotlib charts, which lifts the pressure above the other series
+                view = self.overlay(plot, (-1.5, 0.9), label)
+                curve = pg.PlotDataItem(pen=pg.mkPen('#eb34d8'), connect='finite')
+                curve.setClipToView(True)
+                curve.setDownsampling(auto=True, method='peak')
+                view.addItem(curve)
+                self.curves.append((curve, column))
+            self.marker_views.append((self.overlay(plot, (0, 1)), alarm))
+            self.plots.append(plot)
+        for row, stretch in enumerate((1, 2, 2)):
+            self.graphics.ci.layout.setRowStretchFactor(row, stretch)
+
+    @staticmethod
+    def overlay(plot, y_range, axis_label=None):
+        """ A ViewBox over the plot's, sharing its x-axis, with a fixed y range; with 'axis_label' on the right axis """
+        view = pg.ViewBox()
+        view.setMouseEnabled(False, False)
+        view.setYRange(*y_range, padding=0)
+        # Behind the plot, so the plot keeps the mouse for panning and zooming
+        view.setZValue(-100)
+        plot.scene().addItem(view)
+        view.setXLink(plot)
+        if axis_label is not None:
+            plot.getAxis('right').linkToView(view)
+            plot.getAxis('right').setLabel(axis_label)
+        plot.vb.sigResized.connect(lambda: view.setGeometry(plot.vb.sceneBoundingRect()))
+        view.setGeometry(plot.vb.sceneBoundingRect())
+        return view
+
+    @staticmethod
+    def seconds(times):
+        return np.asarray(times, dtype='datetime64[ns]').astype(np.int64) / 1e9
+
+    def show_chart_data(self, chart_data, instrument_nr):
+        """ Show the charts of 'chart_data' (see prepare_chart_data) over the whole log """
+        self.store = chart_data['store']
+        self.rollups = chart_data['rollups']
+        self.instrument_nr = instrument_nr
+        self.x = self.seconds(self.store['Time'])
+        for curve, column in self.curves:
+            curve.setData(self.x, self.store[column])
+        for view, alarm in self.marker_views:
+            view.clear()
+        self.marker_items = {}
+        self.add_markers(chart_data['intervals'])
+        self.title_label.setText(chart_title(instrument_nr, *chart_data['range']))
+        self.plots[0].enableAutoRange()
+
+    def add_markers(self, intervals):
+        # Door openings at the bottom of every plot, the alarms at the top of their own plot; one bar item per marker
+        # type and plot, extended in live mode (an interval continuing the last one is merged into it)
+        for row, (view, alarm) in enumerate(self.marker_views):
+            for flag, color, y0, y1 in (('door_open', 'k', 0.0, 0.04), (alarm, 'r', 0.95, 1.0)):
+                starts, ends = intervals[flag]
+                if not len(starts):
+                    continue
+                x0, x1 = self.seconds(starts), self.seconds(ends)
+                item = self.marker_items.get((row, flag))
+                if item is None:
+                    item = pg.BarGraphItem(x0=x0, x1=x1, y0=y0, y1=y1, pen=pg.mkPen(color), brush=color)
+                    view.addItem(item)
+                    self.marker_items[(row, flag)] = item
+                    continue
+                last0, last1 = item.opts['x0'], item.opts['x1']
+                if x0[0] <= last1[-1]:
+                    last1 = np.append(last1[:-1], x1[0])
+                    x0, x1 = x0[1:], x1[1:]
+                item.setOpts(x0=np.concatenate((last0, x0)), x1=np.concatenate((last1, x1)))
+
+    def extend(self, store, first_row):
+        """ Add the rows first_row.. of a grown store (live mode); a view that reaches the previous end moves along """
+        if store is not self.store:
+            return
+        previous_end = self.x[-1]
+        self.x = np.concatenate((self.x, self.seconds(store['Time'][len(self.x):])))
+        for curve, column in self.curves:
+            curve.setData(self.x, store[column])
+        times = store['Time']
+        self.add_markers({flag: event_intervals(times[first_row:], store.flag(flag)[first_row:]) for flag in EVENT_FLAGS})
+        self.title_label.setText(chart_title(self.instrument_nr, store.time_index.start.strftime('%Y-%m-%d %H:%M'),
+                                             store.time_index.end.strftime('%Y-%m-%d %H:%M')))
+        view = self.plots[0].vb
+        if not view.autoRangeEnabled()[0]:
+            lo, hi = view.viewRange()[0]
+            if hi >= previous_end:
+                view.setXRange(lo, hi + (self.x[-1] - previous_end), padding=0)
+
+    def export(self):
+        """ Save the visible range as a static matplotlib chart (PNG or PDF) """
+        if self.store is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export charts", f"{self.instrument_nr}_charts.png",
+                                              "PNG image (*.png);;PDF document (*.pdf)")
+        if not path:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=CHART_FIGSIZE)
+        FigureCanvasAgg(fig)
+        axes = draw_chart_figure(fig, prepare_chart_data(self.store, self.rollups), self.instrument_nr)
+        lo, hi = (np.datetime64(int(x * 1e9), 'ns') for x in self.plots[0].vb.viewRange()[0])
+        axes[0].set_xlim(mdates.date2num(lo), mdates.date2num(hi))
+        try:
+            fig.savefig(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not write {path}.\n{e}")
+
 class MainApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"ESPPF Incubation-log Analyzer v.{__version__}")
         self.setMinimumSize(680, 580)  # Set minimum window size
         self.setWindowIcon(QIcon(resource_path('icon.ico')))
+        # Background jobs; at most one running job per kind ('load', 'stats', 'charts')
+        self.thread_pool = QThreadPool()
+        self.jobs = {}
+        self.store = None
+        self.aggregates = None
+        self.rollups = None
+        # (folder, (first, last) 'Time') of a log browsed in streaming mode; statistics re-read it in chunks
+        self.stream_source = None
+        self.stats = None
+        self.stats_instrument_nr = None  # the instrument nr. the shown statistics were computed for
+        # Live mode: the followed folder, its file system watcher and the open chart figures that follow new rows
+        self.tail = None
+        self.watcher = None
+        self.chart_figures = []
+        # Statistics and chart figures of earlier requests on disk
+        self.result_cache = ResultCache()
+        # Stage timings of the recent background jobs (StageRecorder), newest first
+        self.diagnostics = deque(maxlen=30)
+        # File changes arrive in bursts; the folder is polled once they settle
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(500)
+        self.refresh_timer.timeout.connect(self.refresh_live)
+        # Fleet comparison window and the embedded chart view (pyqtgraph), created on first use
+        self.fleet_window = None
+        self.chart_view = None
         self.initUI()
 
 
@@ -42,12 +2285,29 @@ class MainApp(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
+        self.main_layout = main_layout
         
         # Browse section
         browse_button = QPushButton('Browse incubation report CSV files')
         browse_button.clicked.connect(self.browse_folder)
         main_layout.addWidget(browse_button)
         
+        # Streaming mode reads the CSV files in chunks instead of holding the whole log in memory
+        # Live mode follows the folder and appends the rows the device writes
+        options_layout = QHBoxLayout()
+        self.streaming_checkbox = QCheckBox('Low-memory streaming mode (statistics only, for very large logs)')
+        self.live_checkbox = QCheckBox('Live: follow new rows')
+        self.live_checkbox.toggled.connect(self.set_live)
+        # Embedded charts are drawn with pyqtgraph in this window instead of a matplotlib window
+        self.embedded_checkbox = QCheckBox('Embedded charts')
+        self.embedded_checkbox.setEnabled(HAS_PYQTGRAPH)
+        if not HAS_PYQTGRAPH:
+            self.embedded_checkbox.setToolTip(PYQTGRAPH_UNAVAILABLE)
+        options_layout.addWidget(self.streaming_checkbox)
+        options_layout.addWidget(self.live_checkbox)
+        options_layout.addWidget(self.embedded_checkbox)
+        main_layout.addLayout(options_layout)
+        
         # Form layout for instrument and date inputs
         form_layout = QFormLayout()
         
@@ -81,8 +2341,23 @@ class MainApp(QMainWindow):
         generate_charts_button.clicked.connect(self.generate_charts)
         button_layout.addWidget(calculate_button)
         button_layout.addWidget(generate_charts_button)
+        fleet_button = QPushButton('Fleet Comparison')
+        fleet_button.clicked.connect(self.open_fleet)
+        button_layout.addWidget(fleet_button)
         main_layout.addLayout(button_layout)
         
+        # Progress of background jobs (loading, statistics, chart preparation); hidden while idle
+        progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.cancel_button = QPushButton('Cancel')
+        self.cancel_button.clicked.connect(self.cancel_jobs)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        main_layout.addLayout(progress_layout)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        
         # Stats text edit
         self.stats_text_edit = QTextEdit()
         self.stats_text_edit.setReadOnly(True)
@@ -91,6 +2366,29 @@ class MainApp(QMainWindow):
         self.stats_text_edit.textChanged.connect(self.adjust_window_size)
         main_layout.addWidget(self.stats_text_edit)
         
+        # Diagnostics panel: stage timings of the recent jobs, collapsed by default
+        self.diagnostics_button = QPushButton('Diagnostics')
+        self.diagnostics_button.setCheckable(True)
+        self.diagnostics_button.toggled.connect(self.toggle_diagnostics)
+        main_layout.addWidget(self.diagnostics_button)
+        self.diagnostics_panel = QWidget()
+        diagnostics_layout = QVBoxLayout(self.diagnostics_panel)
+        diagnostics_layout.setContentsMargins(0, 0, 0, 0)
+        diagnostics_options = QHBoxLayout()
+        self.capture_checkbox = QCheckBox('Capture cProfile/tracemalloc (slower)')
+        self.capture_checkbox.toggled.connect(self.set_capture)
+        export_button = QPushButton('Export JSON')
+        export_button.clicked.connect(self.export_diagnostics)
+        diagnostics_options.addWidget(self.capture_checkbox)
+        diagnostics_options.addWidget(export_button)
+        diagnostics_layout.addLayout(diagnostics_options)
+        self.diagnostics_text = QTextEdit()
+        self.diagnostics_text.setReadOnly(True)
+        self.diagnostics_text.setFont(monospaced_font)
+        diagnostics_layout.addWidget(self.diagnostics_text)
+        main_layout.addWidget(self.diagnostics_panel)
+        self.diagnostics_panel.hide()
+        
         # Set layout spacing and margins
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -117,86 +2415,244 @@ class MainApp(QMainWindow):
         self.stats_text_edit.setText(text)
         self.adjust_window_size()
 
+    def start_job(self, kind, fn, on_result, *args, progress_text=''):
+        """ Run 'fn(*args)' on the thread pool; a running job of the same kind is cancelled and its results dropped """
+        previous = self.jobs.get(kind)
+        if previous is not None:
+            previous.cancel()
+        worker = Worker(fn, *args)
+        worker.recorder = StageRecorder(kind, capture=self.capture_checkbox.isChecked())
+        self.jobs[kind] = worker
+        # Every slot checks that the worker is still the current job of its kind before touching the GUI
+        worker.signals.progress.connect(lambda done, total, message: self.on_job_progress(worker, kind, done, total, message))
+        worker.signals.result.connect(lambda result: self.on_job_result(worker, kind, on_result, result))
+        worker.signals.error.connect(lambda message: self.jobs.get(kind) is worker and self.on_job_error(kind, message))
+        worker.signals.finished.connect(lambda: self.on_job_finished(worker, kind))
+        self.on_job_progress(worker, kind, 0, 0, progress_text)
+        self.thread_pool.start(worker)
+
+    def cancel_jobs(self):
+        for worker in self.jobs.values():
+            worker.cancel()
+        self.jobs.clear()
+        self.update_progress()
+
+    def on_job_progress(self, worker, kind, done, total, message):
+        if self.jobs.get(kind) is not worker:
+            return
+        # total == 0 shows a busy indicator
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.progress_bar.setFormat(f"{message}  %v/%m" if total else message)
+        self.progress_bar.show()
+        self.cancel_button.show()
+
+    def on_job_error(self, kind, message):
+        if kind == 'stats':
+            self.stats_text_edit.setText(f"Error in processing: {message}")
+        elif kind == 'load':
+            QMessageBox.critical(self, "Missing Data", f"Could not load incubation report files.\n{message}")
+        else:
+            QMessageBox.critical(self, "Error", message)
+
+    def on_job_result(self, worker, kind, on_result, result):
+        if self.jobs.get(kind) is not worker:
+            return
+        # The GUI-thread part (e.g. drawing the charts) is recorded as part of the job
+        with bind_recorder(worker.recorder):
+            on_result(result)
+
+    def on_job_finished(self, worker, kind):
+        if self.jobs.get(kind) is worker:
+            del self.jobs[kind]
+        self.update_progress()
+        recorder = worker.recorder
+        recorder.finish('cancelled' if worker.cancelled.is_set() else 'failed' if worker.failed else 'done')
+        if recorder.job in ('tail', 'stats (live)'):
+            # The polls and refreshes of live mode are summed up in one entry each, so they do not push the other jobs out
+            previous = next((entry for entry in self.diagnostics if entry.job == recorder.job), None)
+            if previous is not None:
+                self.diagnostics.remove(previous)
+                previous.merge(recorder)
+                recorder = previous
+        self.diagnostics.appendleft(recorder)
+        if self.diagnostics_panel.isVisible():
+            self.update_diagnostics()
+
+    def toggle_diagnostics(self, shown):
+        self.diagnostics_panel.setVisible(shown)
+        if shown:
+            self.update_diagnostics()
+
+    def update_diagnostics(self):
+        text = "\n\n".join(recorder.to_text() for recorder in self.diagnostics) or "No jobs have run yet."
+        # The profile of the latest captured job
+        profiled = next((recorder for recorder in self.diagnostics if recorder.profile), None)
+        if profiled is not None:
+            text += f"\n\n\ncProfile of {profiled.job} ({time.strftime('%H:%M:%S', time.localtime(profiled.started))}):\n{profiled.profile}"
+        self.diagnostics_text.setPlainText(f"{text}\n\n\nStart-up:\n{import_report()}")
+
+    def set_capture(self, enabled):
+        # Tracing allocations slows every allocation down, so it only runs while the capture is on
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def export_diagnostics(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export diagnostics", "incu_log_diagnostics.json", "JSON files (*.json)")
+        if not path:
+            return
+        report = {'version': __version__, 'exported': time.strftime('%Y-%m-%d %H:%M:%S'), 'csv_engine': CSV_ENGINE,
+                  'startup': import_times(), 'jobs': [recorder.to_dict() for recorder in self.diagnostics]}
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=1)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not write {path}.\n{e}")
+
+    def update_progress(self):
+        # Hide the progress bar once no job is left running
+        if not self.jobs:
+            self.progress_bar.hide()
+            self.cancel_button.hide()
+
+    def open_fleet(self):
+        if self.fleet_window is None:
+            self.fleet_window = FleetWindow(self)
+        self.fleet_window.show()
+        self.fleet_window.raise_()
+
     def browse_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Directory")
         if folder:
             self.concatenate_csv(folder)
 
     def concatenate_csv(self, folder):
-        all_files = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith('.csv')]
-        header = [
-            'Time', 'Embryo Temp. Setpoint', 'Embryo Temp. Avg', 'Temp. Sensor A Avg',
-            'Temp. Sensor B Avg', 'Baseplate Temp.', 'Incubator Board Temp.',
-            'Bottom Chamber Temp.', 'Backside Temp.', 'Top Chamber Temp.',
-            'CO2 Setpoint', 'CO2 Concentration Avg', 'CO2 Pressure Avg',
-            'CO2 Flow Avg', 'O2 Setpoint', 'O2 Concentration Avg', 'O2 Regulator On',
-            'N2 Pressure Avg', 'N2 Flow Avg', 'UV Light Voltage [mV]',
-            'Temp. Alarm Duration [min]', 'CO2 Alarm Duration [min]',
-            'O2 Alarm Duration [min]', 'Door Open Duration [s]'
-        ]
-        dtype = {
-        'Embryo Temp. Setpoint': 'float32', 'Embryo Temp. Avg': 'float32',
-        'Temp. Sensor A Avg': 'float32', 'Temp. Sensor B Avg': 'float32', 'Baseplate Temp.': 'float32',
-        'Incubator Board Temp.': 'float32', 'Bottom Chamber Temp.': 'float32', 'Backside Temp.': 'float32',
-        'Top Chamber Temp.': 'float32', 'CO2 Setpoint': 'float32', 'CO2 Concentration Avg': 'float32',
-        'CO2 Pressure Avg': 'float32', 'CO2 Flow Avg': 'float32', 'O2 Setpoint': 'float32',
-        'O2 Concentration Avg': 'float32', 'O2 Regulator On': 'bool', 'N2 Pressure Avg': 'float32',
-        'N2 Flow Avg': 'float32', 'UV Light Voltage [mV]': 'float32',
-        'Temp. Alarm Duration [min]': 'float32', 'CO2 Alarm Duration [min]': 'float32',
-        'O2 Alarm Duration [min]': 'float32', 'Door Open Duration [s]': 'float32'
-        }
-        # Read all CSV files in the folder and concatenate them into a single dataframe
-        # The 'Time' column is parsed as a datetime object and the header is set to the defined header
-        # The 'dtype' parameter is used to specify the data types of the columns
-        df_list = [pd.read_csv(f, sep=';', names=header, header=0, dtype=dtype, parse_dates=['Time']) for f in all_files]
-        raw_df = pd.concat(df_list, ignore_index=True)
-        
-        # Just floor to minutes after parsing
-        raw_df['Time'] = raw_df['Time'].dt.floor('min')
-    
-        # Sort and remove duplicates
-        raw_df = raw_df.sort_values(by='Time').drop_duplicates(subset='Time').reset_index(drop=True)
-        
-        # copy raw_df as 'combined_df' for further processing: incubation statistics and graphs
-        combined_df = raw_df.copy()
+        # Read all CSV files in the folder (in parallel, re-using cached files) on a background thread
+        # The 'Time' column is parsed as a datetime object, floored to minutes, sorted and de-duplicated
+        # A new browse supersedes a load that is still running
+        if self.streaming_checkbox.isChecked():
+            # Streaming mode only scans the 'Time' column for the data range
+            self.start_job('load', scan_log_range, lambda log_range: self.on_range_scanned(folder, log_range), folder,
+                           progress_text=f"Scanning {folder}")
+            return
+        # The files are followed from their current end, so rows written while loading are not missed
+        tail = LogTail(folder)
+        self.start_job('load', load_log_data, lambda store: self.on_data_loaded(store, tail), folder,
+                       progress_text=f"Loading {folder}")
+
+    def on_data_loaded(self, store, tail=None):
+        # Store the loaded log in the class instance
+        self.store = store
+        self.aggregates = None
+        self.rollups = None
+        self.stream_source = None
+        self.stats = None
+        self.tail = tail
+        self.chart_figures = []
+        # Precompute the window aggregates in the background; statistics scan the rows until they are ready
+        self.start_job('aggregates', aggregates_job, lambda aggregates: self.on_aggregates_ready(aggregates, store),
+                       store, progress_text="Indexing statistics")
+        # The chart rollups come from the cache if the files are unchanged since they were built
+        self.start_job('rollups', rollups_job, lambda rollups: self.on_rollups_ready(rollups, store),
+                       store, progress_text="Building chart rollups")
+        self.show_data_range(store)
+        self.set_live(self.live_checkbox.isChecked())
+
+    def show_data_range(self, store):
+        # Display the data range and the memory footprint in the stats_text_edit text field
+        data_range_min = store.time_index.start.strftime('%Y-%m-%d %H:%M')
+        data_range_max = store.time_index.end.strftime('%Y-%m-%d %H:%M')
+        memory_mb = store.memory_usage() / 2**20
+        self.stats_text_edit.setText(f"Incubation log date-range:\n\nfrom {data_range_min} to {data_range_max}\n({len(store)} rows, {memory_mb:.1f} MB in memory)\n-----------------------------------------\nPick a valid timeframe for calculating statistics.")
 
         
-        ### combined_df now contains the concatenated data with the defined header
-        # introduce a new columns, convert them to boolean: 'temp_alarm', 'co2_alarm', 'o2_alarm', 'door_open', based on the alarm durations and door open duration;
-        combined_df['temp_alarm'] = combined_df['Temp. Alarm Duration [min]'].apply(lambda x: 1 if x > 0 else 0).astype(bool)
-        combined_df['co2_alarm'] = combined_df['CO2 Alarm Duration [min]'].apply(lambda x: 1 if x > 0 else 0).astype(bool)
-        combined_df['o2_alarm'] = combined_df['O2 Alarm Duration [min]'].apply(lambda x: 1 if x > 0 else 0).astype(bool)
-        combined_df['door_open'] = combined_df['Door Open Duration [s]'].apply(lambda x: 1 if x > 0 else 0).astype(bool)
-                
-        # Drop columns that are not needed for the incubation stats and graphs
-        combined_df = combined_df.drop(columns=['Temp. Sensor A Avg', 'Temp. Sensor B Avg', 'Temp. Alarm Duration [min]', 'CO2 Alarm Duration [min]',
-                                                'O2 Alarm Duration [min]', 'Door Open Duration [s]', 'UV Light Voltage [mV]', 'Incubator Board Temp.', 'Baseplate Temp.',
-                                                'Bottom Chamber Temp.', 'Backside Temp.', 'Top Chamber Temp.'])
-        
- 
-        # copy combined_df as 'combinded_other' for further processing: Stats of 'Other tab'
-        combined_other = raw_df.copy()
-        # Drop columns that are not needed for the 'Other' tab stats
-        combined_other = combined_other.drop(columns=['Embryo Temp. Setpoint', 'Embryo Temp. Avg', 'CO2 Setpoint', 'CO2 Concentration Avg', 'CO2 Pressure Avg',
-            'CO2 Flow Avg', 'O2 Setpoint', 'O2 Concentration Avg', 'O2 Regulator On', 'N2 Pressure Avg', 'N2 Flow Avg', 'Temp. Alarm Duration [min]',
-             'CO2 Alarm Duration [min]', 'O2 Alarm Duration [min]', 'Door Open Duration [s]'])
-        
-        # Delete raw_df to free up memory
-        del raw_df
 
-        # Force garbage collection
-        gc.collect()
+    def on_range_scanned(self, folder, log_range):
+        # Drop a previously loaded log; statistics stream from the folder from now on
+        self.store = None
+        self.aggregates = None
+        self.rollups = None
+        self.stream_source = (folder, log_range)
+        self.stats = None
+        self.tail = None
+        self.set_live(False)
+        data_range_min = log_range[0].strftime('%Y-%m-%d %H:%M')
+        data_range_max = log_range[1].strftime('%Y-%m-%d %H:%M')
+        self.stats_text_edit.setText(f"Incubation log date-range:\n\nfrom {data_range_min} to {data_range_max}\n(streaming mode, not held in memory)\n-----------------------------------------\nPick a valid timeframe for calculating statistics.")
 
-        # Store the combined dataframe in the class instance
-        self.combined_df = combined_df
-        self.combined_other = combined_other
-                
-        # Display the data range in the stats_text_edit text field
-        data_range_min = combined_df['Time'].min().strftime('%Y-%m-%d %H:%M')
-        data_range_max = combined_df['Time'].max().strftime('%Y-%m-%d %H:%M')
-        self.stats_text_edit.setText(f"Incubation log date-range:\n\nfrom {data_range_min} to {data_range_max}\n-----------------------------------------\nPick a valid timeframe for calculating statistics.")
+    def set_live(self, enabled):
+        # Follow the loaded folder: changes of its files (or new files) trigger a poll of the appended lines
+        if self.watcher is not None:
+            self.watcher.deleteLater()
+            self.watcher = None
+        if not enabled or self.tail is None:
+            return
+        self.watcher = QFileSystemWatcher([self.tail.folder] + self.tail.paths(), self)
+        self.watcher.fileChanged.connect(self.refresh_timer.start)
+        self.watcher.directoryChanged.connect(self.refresh_timer.start)
+        # Pick up the rows written since the folder was browsed
+        self.refresh_timer.start()
 
-        
+    def refresh_live(self):
+        if self.watcher is None or self.store is None:
+            return
+        if 'tail' in self.jobs:
+            # One poll at a time; try again once the running one is done
+            self.refresh_timer.start()
+            return
+        store = self.store
+        self.start_job('tail', tail_job, lambda new_df: self.on_rows_appended(new_df, store), self.tail,
+                       progress_text="Reading new log rows")
+
+    def on_rows_appended(self, new_df, store):
+        if store is not self.store or self.watcher is None:
+            return
+        # Watch files that appeared since, and files replaced on disk (the watcher drops those)
+        missing = set(self.tail.paths()) - set(self.watcher.files())
+        if missing:
+            self.watcher.addPaths(sorted(missing))
+        if new_df is None:
+            return
+        first_row = len(store)
+        previous_end = store.time_index.end
+        if not store.append(new_df):
+            return
+
+        if self.aggregates is not None:
+            self.aggregates.extend(store)
+        if self.rollups is not None:
+            self.rollups.extend(store)
+        # Open charts take the new rows; closed ones are forgotten
+        self.chart_figures = [(fig, nr) for fig, nr in self.chart_figures if plt.fignum_exists(fig.number)]
+        for fig, instrument_nr in self.chart_figures:
+            extend_chart_figure(fig, store, first_row, instrument_nr)
+        if self.chart_view is not None:
+            self.chart_view.extend(store, first_row)
+
+        # Statistics up to the end of the data follow the new rows (the inputs were validated when they were computed);
+        # otherwise the date range is refreshed
+        if self.stats is not None and self.stats.end >= previous_end:
+            instrument_nr = self.stats_instrument_nr
+            self.start_job('stats', statistics_job, lambda stats: self.on_statistics_ready(stats, instrument_nr),
+                           store, self.stats.start, store.time_index.end, self.aggregates, self.result_cache,
+                           instrument_nr, self.stats, progress_text="Refreshing statistics")
+            self.jobs['stats'].recorder.job = 'stats (live)'
+        elif self.stats is None:
+            self.show_data_range(store)
+
+    def on_rollups_ready(self, rollups, store):
+        if store is self.store:
+            # Catch up with rows appended while they were built
+            rollups.extend(store)
+            self.rollups = rollups
+
+    def on_aggregates_ready(self, aggregates, store):
+        # Only attach the aggregates to the data they were built from, caught up with rows appended meanwhile
+        if store is self.store:
+            aggregates.extend(store)
+            self.aggregates = aggregates
 
     def calculate_statistics(self):
         # Check if self.instrument_input is empty or not defined
@@ -204,13 +2660,13 @@ class MainApp(QMainWindow):
             QMessageBox.critical(self, "Missing Data", "Enter the instrument number.")
             return
                 
-        # Check if combined_df is defined
-        if not hasattr(self, 'combined_df'):
+        # Check if the log is loaded
+        if self.store is None and self.stream_source is None:
             QMessageBox.critical(self, "Missing Data", "Missing incubation report input data.\nBrowse and select a folder with valid incubation report .CSV files.")
             return
         
-        # Check if combined_df is empty or not generated yet
-        if self.combined_df is None or self.combined_df.empty:
+        # Check if the loaded log is empty
+        if self.store is not None and len(self.store) == 0:
             QMessageBox.critical(self, "Missing Data", "Missing incubation report input data.")
             return
         instrument_nr = self.instrument_input.text()
@@ -237,240 +2693,391 @@ class MainApp(QMainWindow):
             return
 
         # Check if the date range is within the bounds of the data
-        input_range_min = self.combined_df['Time'].min()
-        input_range_max = self.combined_df['Time'].max()
-        if filter_start < input_range_min or filter_end > input_range_max:
+        if self.store is None:
+            folder, (input_range_min, input_range_max) = self.stream_source
+        else:
+            input_range_min = self.store.time_index.start
+            input_range_max = self.store.time_index.end
+        if not (input_range_min <= filter_start and filter_end <= input_range_max):
             QMessageBox.critical(self, "Invalid Date Range", f"Enter a valid date range between {input_range_min} and {input_range_max}.")
             return
 
-        if self.combined_df is not None and filter_start and filter_end:            
-            # Filter self.combined_df based on the dates
-            filtered_df = self.combined_df[(self.combined_df['Time'] >= filter_start) & (self.combined_df['Time'] <= filter_end)]
-            if filtered_df.empty:
-                QMessageBox.critical(self, "No Data", "No data available for the specified date range.")
-                return
-            temp = filtered_df['Embryo Temp. Avg'].round(2)
-            temp_sp = filtered_df['Embryo Temp. Setpoint'].iloc[-1]
-            co2_conc = filtered_df['CO2 Concentration Avg'].round(2)
-            co2_sp = filtered_df['CO2 Setpoint'].iloc[-1]
-            co2_press = filtered_df['CO2 Pressure Avg'].round(2)
-            co2_flow = filtered_df['CO2 Flow Avg'].round(2)
-            o2_conc = filtered_df['O2 Concentration Avg'].round(2)
-            o2_sp = filtered_df['O2 Setpoint'].iloc[-1]
-            n2_press = filtered_df['N2 Pressure Avg'].round(2)
-            n2_flow = filtered_df['N2 Flow Avg'].round(2)
-
-            stats_to_export = [
-                ['Temperature(°C)', temp.min(), temp.max(), temp.mean(), temp.median(), temp.std(), temp_sp],
-                ['CO2 conc.(%)', co2_conc.min(), co2_conc.max(), co2_conc.mean(), co2_conc.median(), co2_conc.std(), co2_sp],                
-                ['CO2 flow(l/h)', co2_flow.min(), co2_flow.max(), co2_flow.mean(), co2_flow.median(), co2_flow.std()],
-                ['CO2 press.(bar)', co2_press.min(), co2_press.max(), co2_press.mean(), co2_press.median(), co2_press.std()],
-                ['O2 conc.(%)', o2_conc.min(), o2_conc.max(), o2_conc.mean(), o2_conc.median(), o2_conc.std(), o2_sp],                
-                ['N2 flow(l/h)', n2_flow.min(), n2_flow.max(), n2_flow.mean(), n2_flow.median(), n2_flow.std()],
-                ['N2 press.(bar)', n2_press.min(), n2_press.max(), n2_press.mean(), n2_press.median(), n2_press.std()]
-            ]
-            # Filter self.combined_other based on the dates
-            filtered_other_df = self.combined_other[(self.combined_other['Time'] >= filter_start) & (self.combined_other['Time'] <= filter_end)]
-            inc_board_temp = filtered_other_df['Incubator Board Temp.'].round(2)
-            baseplate_temp = filtered_other_df['Baseplate Temp.'].round(2)
-            bottom_chamber_temp = filtered_other_df['Bottom Chamber Temp.'].round(2)
-            backside_temp = filtered_other_df['Backside Temp.'].round(2)
-            top_chamber_temp = filtered_other_df['Top Chamber Temp.'].round(2)
-            UV_light_voltage = filtered_other_df['UV Light Voltage [mV]'].round(2)
-            temp_sensor_A = filtered_other_df['Temp. Sensor A Avg'].round(2)
-            temp_sensor_B = filtered_other_df['Temp. Sensor B Avg'].round(2)
-
-            other_stats_to_export = [                
-                ['Baseplate Temp.(°C)', baseplate_temp.min(), baseplate_temp.max(), baseplate_temp.mean(), baseplate_temp.median(), baseplate_temp.std()],
-                ['Incubator Board Temp.(°C)', inc_board_temp.min(), inc_board_temp.max(), inc_board_temp.mean(), inc_board_temp.median(), inc_board_temp.std()],
-                ['Bottom Chamber Temp.(°C)', bottom_chamber_temp.min(), bottom_chamber_temp.max(), bottom_chamber_temp.mean(), bottom_chamber_temp.median(), bottom_chamber_temp.std()],                
-                ['Backside Temp.(°C)', backside_temp.min(), backside_temp.max(), backside_temp.mean(), backside_temp.median(), backside_temp.std()],
-                ### Add the following lines to the 'other_stats_to_export' list:
-                ## 'Temp. Sensor A Avg', 'Temp. Sensor B Avg'
-                ['Temp. Sensor A Avg(°C)', temp_sensor_A.min(), temp_sensor_A.max(), temp_sensor_A.mean(), temp_sensor_A.median(), temp_sensor_A.std()],
-                ['Temp. Sensor B Avg(°C)', temp_sensor_B.min(), temp_sensor_B.max(), temp_sensor_B.mean(), temp_sensor_B.median(), temp_sensor_B.std()],
-                ['Top Chamber Temp.(°C)', top_chamber_temp.min(), top_chamber_temp.max(), top_chamber_temp.mean(), top_chamber_temp.median(), top_chamber_temp.std()],                
-                ['UV Light Voltage (mV)', UV_light_voltage.min(), UV_light_voltage.max(), UV_light_voltage.mean(), UV_light_voltage.median(), UV_light_voltage.std()]
-            ]
-
-            # Combine both statistics lists with a separator
-            separator = ['-----------------------------']  # Adjust the number of columns as needed
-            combined_stats_to_export = stats_to_export + [separator] + other_stats_to_export
-
-
-            # Column extraction and statistics calculation
-            if self.combined_df is not None:
-                try:
-                    # Use the 'tabulate' library to create a formatted table string from 'stats_to_export'
-                    # The headers are set to represent different statistical measures
-                    # The table format is set to "simple" and float numbers are formatted to 2 decimal places
-                    stat_headers = ['Sensor', 'MIN', 'MAX', 'AVG', 'Median', 'Std', 'SP']            
-                    
-                    # Create the combined statistics table
-                    combined_stats = tabulate(combined_stats_to_export, stat_headers, tablefmt="simple", numalign="decimal", floatfmt=".2f")
-
-                    # Set the formatted stats as the text of the QTextEdit widget
-                    self.setText(f"Incubation log statistics; {instrument_nr}\nSeleceted timeframe: {filter_start} - {filter_end}\n\n{combined_stats}")
-                    
-                    
-                except Exception as e:
-                    self.stats_text_edit.setText(f"Error in processing: {str(e)}")
+        if self.store is None:
+            # Streaming mode: one chunked pass over the folder
+            self.start_job('stats', stream_statistics, lambda result: self.on_statistics_ready(result[0][0], instrument_nr),
+                           folder, [(filter_start, filter_end)], progress_text="Streaming statistics")
+            return
+
+        # Compute the statistics on a background thread; a new request supersedes a running one
+        self.start_job('stats', statistics_job, lambda stats: self.on_statistics_ready(stats, instrument_nr),
+                       self.store, filter_start, filter_end, self.aggregates, self.result_cache, instrument_nr, self.stats,
+                       progress_text="Calculating statistics")
+
+    def on_statistics_ready(self, stats, instrument_nr):
+        if stats is None:
+            QMessageBox.critical(self, "No Data", "No data available for the specified date range.")
+            return
+        # Set the formatted stats as the text of the QTextEdit widget
+        self.stats = stats
+        self.stats_instrument_nr = instrument_nr
+        self.setText(stats_report(stats, instrument_nr))
 
 #### generate_charts_button.clicked action is defined below:
 
-# combined_df columns with their index numbers:
-        # 0: 'Time'
-        # 1: 'Embryo Temp. Setpoint'
-        # 2: 'Embryo Temp. Avg'
-        # 3: 'CO2 Setpoint'
-        # 4: 'CO2 Concentration Avg'
-        # 5: 'CO2 Pressure Avg'
-        # 6: 'CO2 Flow Avg'
-        # 7: 'O2 Setpoint'
-        # 8: 'O2 Concentration Avg'
-        # 9: 'O2 Regulator On'
-        # 10: 'N2 Pressure Avg'
-        # 11: 'N2 Flow Avg'
-        # 12: 'temp_alarm'
-        # 13: 'co2_alarm'
-        # 14: 'o2_alarm'
-        # 15: 'door_open'
-     
-    
     def generate_charts(self):
-        # Check if combined_df is defined
-        if not hasattr(self, 'combined_df'):
+        # Check if the log is loaded
+        if self.store is None:
+            if self.stream_source is not None:
+                QMessageBox.critical(self, "Streaming Mode", "Charts need the whole log in memory.\nUncheck the streaming mode and browse the folder again.")
+                return
             QMessageBox.critical(self, "Missing Data", "Missing incubation report input data.")
             return
 
-        # Define the chart range based on the data; min and max values of the 'Time' column
-        chart_range_min = self.combined_df['Time'].min().strftime('%Y-%m-%d %H:%M')
-        chart_range_max = self.combined_df['Time'].max().strftime('%Y-%m-%d %H:%M')
+        # Prepare the chart data (date range, event intervals) on a background thread, then draw on the GUI thread
         instrument_nr = self.instrument_input.text()
-        # Create a new figure and specify the number of rows and columns for subplots
-        fig, axes = plt.subplots(nrows=3, ncols=1, figsize=(12, 8), sharex=True, gridspec_kw={'height_ratios': [1, 2, 2]}, num=(f'Incubation data; instrument nr. {instrument_nr}.'))
-        
-        # Define a formatter function for the Y-axis ticks
-        def y_axis_formatter(x, pos):
-            return f'{x:.1f}'
-
-        # Plot 1 Temperature (Embryo Temp. Avg; + SP):
-        axes[0].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[1]], label=self.combined_df.columns[1], color='#4a4a4a', linewidth=0.75, linestyle='dashed')
-        axes[0].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[2]], label=self.combined_df.columns[2], color='#3232a8', linewidth=0.75)
-        axes[0].set_ylabel('Temp.°C')
-        axes[0].set_title(f'Incubation data; instrument nr. {instrument_nr}; From {chart_range_min} to {chart_range_max}')
-        axes[0].tick_params(axis='y', labelsize=7)  # Change the tick font size on the left Y-axis
-        
+        self.start_job('charts', prepare_chart_data, lambda chart_data: self.draw_charts(chart_data, instrument_nr),
+                       self.store, self.rollups, self.result_cache, instrument_nr, progress_text="Preparing charts")
 
-        # Plot 2: CO2 SP, CO2 conc.; CO2 Flow
-        axes[1].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[3]], label=self.combined_df.columns[3], color='#4a4a4a', linewidth=0.75, linestyle='dashed')
-        axes[1].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[4]], label=self.combined_df.columns[4], color='#3232a8', linewidth=0.75)
-        axes[1].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[6]], label=self.combined_df.columns[6], color='#73f707', linewidth=0.75)
-        axes[1].set_ylabel('Co2 conc.(%) / Flow(l/h)')        
-        axes[1].tick_params(axis='y', labelsize=7)  # Change the tick font size on the left Y-axis
-        axes[1].yaxis.set_major_formatter(FuncFormatter(y_axis_formatter))  # Set the number format for the left Y-axis
-        
-        #### Apply top-padding on the left Y-axis as a percentage of the chart height
-        # if the highest value of CO2 flow is higher than CO2 conc.: apply padding based on CO2 flow
-        # if the highest value of CO2 conc. is higher than CO2 flow: apply padding based on CO2 conc.
-        if self.combined_df[self.combined_df.columns[4]].max() > self.combined_df[self.combined_df.columns[6]].max():
-            co2_scale_max = self.combined_df[self.combined_df.columns[4]].max()
+    def draw_charts(self, chart_data, instrument_nr):
+        if self.embedded_checkbox.isChecked():
+            self.show_embedded_charts(chart_data, instrument_nr)
+            return
+        title = f'Incubation data; instrument nr. {instrument_nr}.'
+        fig = None
+        if chart_data['figure'] is not None:
+            # The same chart was drawn before from the same files
+            with stage('restore charts'):
+                fig = restore_chart_figure(chart_data['figure'], chart_data['store'], chart_data['rollups'])
+        if fig is not None:
+            fig.canvas.manager.set_window_title(title)
         else:
-            co2_scale_max = self.combined_df[self.combined_df.columns[6]].max()
-        axes[1].set_ylim(top=(co2_scale_max * 1.3)) # add 30% padding on top of the highest value
-
-        # Create a secondary y-axis for CO2 Pressure
-        axes_secy1 = axes[1].twinx()
-        axes_secy1.plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[5]], label=self.combined_df.columns[5], color='#eb34d8', linewidth=0.75)
-        axes_secy1.set_ylabel('Co2 Pressure (bar)')
-        # Set the y-axis limits with some padding below zero to elevate scale and separate from conc and flow.
-        axes_secy1.set_ylim(-1.5, 0.9)  
-        # Define custom tick positions for CO2 Pressure
-        axes_secy1.set_yticks([0.0, 0.2, 0.4, 0.6, 0.8])  # Adjust values based on data range
-        axes_secy1.tick_params(axis='y', labelsize=7)
-        
-        
+            # Create a new figure and draw the charts on it
+            fig = plt.figure(figsize=CHART_FIGSIZE, num=title)
+            with stage('draw charts'):
+                draw_chart_figure(fig, chart_data, instrument_nr)
+            if chart_data['cache_key'] is not None:
+                with stage('cache charts'):
+                    self.result_cache.put(chart_data['cache_key'], figure_state(fig))
+        self.chart_figures.append((fig, instrument_nr))
 
-        # Plot 3: O2 SP; O2 conc.; N2 Flow
-        axes[2].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[7]], label=self.combined_df.columns[7], color='#4a4a4a', linewidth=0.75, linestyle='dashed')
-        axes[2].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[8]], label=self.combined_df.columns[8], color='#3232a8', linewidth=0.75)
-        axes[2].plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[11]], label=self.combined_df.columns[11], color='#73f707', linewidth=0.75)
-        axes[2].set_ylabel('O2 conc.(%) / N2 Flow(l/h)')        
-        axes[2].tick_params(axis='y', labelsize=7)  # Change the tick font size on the left Y-axis
-        axes[2].yaxis.set_major_formatter(FuncFormatter(y_axis_formatter))  # Set the number format for the left Y-axis
-        
-        #### Apply top-padding on the left Y-axis as a percentage of the chart height
-        # if the highest value of N2 flow is higher than O2 conc.: apply padding based on N2 flow
-        # if the highest value of O2 conc. is higher than N2 flow: apply padding based on O2 conc.
-        if self.combined_df[self.combined_df.columns[8]].max() > self.combined_df[self.combined_df.columns[11]].max():
-            O2_scale_max = self.combined_df[self.combined_df.columns[8]].max()
-        else:
-            O2_scale_max = self.combined_df[self.combined_df.columns[11]].max()        
-        axes[2].set_ylim(top=(O2_scale_max * 1.3)) # add 30% padding on top of the highest value
-
-       
-        # Create a secondary y-axis for N2 Pressure
-        axes_secy2 = axes[2].twinx()
-        axes_secy2.plot(self.combined_df[self.combined_df.columns[0]], self.combined_df[self.combined_df.columns[10]], label=self.combined_df.columns[10], color='#eb34d8', linewidth=0.75)
-        axes_secy2.set_ylabel('N2 Pressure (bar)')
-        # Set the y-axis limits with some padding below zero to elevate scale and separate from conc and flow.
-        axes_secy2.set_ylim(-1.5, 0.9)  
-        # Define custom tick positions for N2 Pressure
-        axes_secy2.set_yticks([0.0, 0.2, 0.4, 0.6, 0.8])   # Adjust values based on data range
-        axes_secy2.tick_params(axis='y', labelsize=7)
-        
+        # Display the plots
+        plt.show()
 
-        # Add vertical lines for door_open, temp_alarm, co2_alarm, and o2_alarm event markings:
-        for idx, row in self.combined_df.iterrows():
-            if row[self.combined_df.columns[15]]:
-                for ax in axes:
-                    ax.axvline(x=row[self.combined_df.columns[0]], color='black', linestyle='-.', linewidth=0.75, ymin=0.00, ymax=0.04) # ymin and ymax values to set the height of the line
-            if row[self.combined_df.columns[12]]:
-                axes[0].axvline(x=row[self.combined_df.columns[0]], color='red', linestyle='dotted', linewidth=0.75, ymin=0.95, ymax=1.0)
-            if row[self.combined_df.columns[13]]:
-                axes[1].axvline(x=row[self.combined_df.columns[0]], color='red', linestyle='dotted', linewidth=0.75, ymin=0.95, ymax=1.0)
-            if row[self.combined_df.columns[14]]:
-                axes[2].axvline(x=row[self.combined_df.columns[0]], color='red', linestyle='dotted', linewidth=0.75, ymin=0.95, ymax=1.0)
-
-        # Create custom legend entries for the vertical lines
-        custom_lines = [
-            Line2D([0], [0], color='black', linestyle='-.', linewidth=0.75, label='Door opening'),
-            Line2D([0], [0], color='red', linestyle='dotted', linewidth=0.75, label='Sensor alarm'),
-            Line2D([0], [0], color='#4a4a4a', linestyle='dashed', linewidth=0.75, label='Set point'),
-            Line2D([0], [0], color='#3232a8', linestyle='solid', linewidth=0.75, label='Conc.\nTemp.'),
-            Line2D([0], [0], color='#73f707', linestyle='solid', linewidth=0.75, label='Flow'),
-            Line2D([0], [0], color='#eb34d8', linestyle='solid', linewidth=0.75, label='Pressure')
-                   ]
-        # Add the custom legend to the figure
-        fig.legend(handles=custom_lines, fontsize='7', loc='upper right')
-
-        # Adjust the spacing between subplots
-        plt.tight_layout()
-        
-        # Set the locator
-        locator = mdates.AutoDateLocator(minticks=10, maxticks=50)
-        formatter = mdates.ConciseDateFormatter(locator)
-        axes[2].xaxis.set_major_locator(locator)
-        axes[2].xaxis.set_major_formatter(formatter)
-        axes[2].set_xlabel('Date / time')
+    def show_embedded_charts(self, chart_data, instrument_nr):
+        if self.chart_view is None:
+            self.chart_view = FastChartView()
+            self.main_layout.insertWidget(self.main_layout.indexOf(self.stats_text_edit) + 1, self.chart_view, 3)
+        with stage('draw embedded charts'):
+            self.chart_view.show_chart_data(chart_data, instrument_nr)
+        self.chart_view.show()
 
-        # Customize the tick font size on the X-axis for all subplots
-        for ax in axes:
-            ax.tick_params(axis='x', labelsize=8)  # Change the tick font size on the X-axis
 
+class FleetWindow(QWidget):
+    """ Fleet mode: statistics and small-multiple charts of several instruments over one timeframe
+        The instruments are kept in a FleetStore, so folders that are loaded and unchanged are not read again.
+        Jobs run through the main window, which shows their progress. """
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+        self.setWindowTitle("Fleet comparison")
+        self.setWindowIcon(QIcon(resource_path('icon.ico')))
+        self.setMinimumSize(760, 580)
+        self.fleet = FleetStore()
+        self.folders = {}  # instrument nr. -> folder
+        self.initUI()
 
-        # Display the plots
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        # Instrument folders with their instrument nr. (the folder name, unless another one is entered)
+        self.folder_list = QListWidget()
+        layout.addWidget(self.folder_list)
+        folder_buttons = QHBoxLayout()
+        add_button = QPushButton('Add instrument folder')
+        add_button.clicked.connect(self.add_folder)
+        remove_button = QPushButton('Remove selected')
+        remove_button.clicked.connect(self.remove_selected)
+        folder_buttons.addWidget(add_button)
+        folder_buttons.addWidget(remove_button)
+        layout.addLayout(folder_buttons)
+
+        form_layout = QFormLayout()
+        self.limit_spin = QSpinBox()
+        self.limit_spin.setRange(1, 64)
+        self.limit_spin.setValue(self.fleet.max_instruments)
+        form_layout.addRow('Instruments kept in memory:', self.limit_spin)
+        date_layout = QHBoxLayout()
+        self.start_date_input = QLineEdit()
+        self.start_date_input.setPlaceholderText('Start date&time')
+        self.end_date_input = QLineEdit()
+        self.end_date_input.setPlaceholderText('End date&time')
+        date_layout.addWidget(self.start_date_input)
+        date_layout.addWidget(self.end_date_input)
+        form_layout.addRow('Timeframe (YYYY-MM-DD hh:mm):', date_layout)
+        self.sensor_combo = QComboBox()
+        for group in STATS_GROUPS:
+            for spec in group:
+                self.sensor_combo.addItem(spec[0], spec)
+        form_layout.addRow('Chart sensor:', self.sensor_combo)
+        layout.addLayout(form_layout)
+
+        button_layout = QHBoxLayout()
+        stats_button = QPushButton('Compare Statistics')
+        stats_button.clicked.connect(self.compare_statistics)
+        charts_button = QPushButton('Small-multiple Charts')
+        charts_button.clicked.connect(self.compare_charts)
+        button_layout.addWidget(stats_button)
+        button_layout.addWidget(charts_button)
+        layout.addLayout(button_layout)
+
+        self.stats_text_edit = QTextEdit()
+        self.stats_text_edit.setReadOnly(True)
+        self.stats_text_edit.setFont(QFont("Consolas", 9))
+        layout.addWidget(self.stats_text_edit)
+
+    def add_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select an instrument log folder")
+        if not folder:
+            return
+        folder = os.path.normpath(folder)
+        if folder in self.folders.values():
+            QMessageBox.critical(self, "Duplicate Folder", f"{folder} is already listed.")
+            return
+        # Folders of different instruments may share a name (e.g. '.../logs'), so the instrument nr. must be unique
+        nr = os.path.basename(folder)
+        while True:
+            nr, ok = QInputDialog.getText(self, "Instrument nr.", f"Instrument nr. of {folder}:", text=nr)
+            nr = nr.strip()
+            if not ok or not nr:
+                return
+            if nr not in self.folders:
+                break
+            QMessageBox.critical(self, "Duplicate Instrument", f"Instrument nr. {nr} is already listed for {self.folders[nr]}.\nEnter a different instrument nr.")
+        self.folders[nr] = folder
+        self.refresh_list()
+
+    def remove_selected(self):
+        for item in self.folder_list.selectedItems():
+            self.folders.pop(item.data(Qt.UserRole), None)
+        self.refresh_list()
+
+    def refresh_list(self):
+        self.folder_list.clear()
+        for nr, folder in self.folders.items():
+            self.folder_list.addItem(f"{nr}    {folder}")
+            self.folder_list.item(self.folder_list.count() - 1).setData(Qt.UserRole, nr)
+
+    def timeframe(self):
+        """ The (start, end) of the date inputs, or None after telling the user what is wrong """
+        try:
+            start, end = parse_timeframe(self.start_date_input.text(), self.end_date_input.text())
+        except ValueError:
+            QMessageBox.critical(self, "Invalid Date Format", "Enter valid date and time in the format YYYY-MM-DD hh:mm.")
+            return None
+        if start >= end:
+            QMessageBox.critical(self, "Invalid Date Range", "Start date must be less than end date.")
+            return None
+        return start, end
+
+    def with_loaded(self, then):
+        """ Call then({instrument nr.: LogStore}) once every listed instrument is resident
+            Only the folders that are not loaded or changed since are read, concurrently on a background thread. """
+        instruments = list(self.folders)
+        if not instruments:
+            QMessageBox.critical(self, "Missing Data", "Add the log folders of the instruments to compare.")
+            return
+        self.fleet.max_instruments = self.limit_spin.value()
+        if len(instruments) > self.fleet.max_instruments:
+            QMessageBox.critical(self, "Too Many Instruments",
+                                 f"{len(instruments)} instruments are listed, but at most {self.fleet.max_instruments} are kept in memory.")
+            return
+        missing = [(nr, folder) for nr, folder in self.folders.items() if not self.fleet.is_current(nr, folder)]
+        if not missing:
+            then(self.fleet.select(instruments))
+            return
+        self.app.start_job('fleet load', load_fleet, lambda stores: self.on_fleet_loaded(stores, instruments, then),
+                           missing, progress_text=f"Loading {len(missing)} instruments")
+
+    def on_fleet_loaded(self, stores, instruments, then):
+        for nr, store in stores.items():
+            self.fleet.add(nr, store, keep=instruments)
+        then(self.fleet.select(instruments))
+
+    def compare_statistics(self):
+        timeframe = self.timeframe()
+        if timeframe is None:
+            return
+        self.with_loaded(lambda stores: self.app.start_job(
+            'fleet stats', fleet_statistics_job, lambda results: self.stats_text_edit.setText(fleet_report(results, *timeframe)),
+            stores, *timeframe, progress_text="Calculating fleet statistics"))
+
+    def compare_charts(self):
+        timeframe = self.timeframe()
+        if timeframe is None:
+            return
+        self.with_loaded(lambda stores: self.draw_charts(stores, self.sensor_combo.currentData(), *timeframe))
+
+    def draw_charts(self, stores, spec, start, end):
+        fig = plt.figure(figsize=(12, 8), num=f'Fleet comparison; {spec[0]}')
+        draw_fleet_figure(fig, stores, spec, start, end)
         plt.show()
 
+def parse_timeframe(start, end):
+    """ Parse a 'YYYY-MM-DD hh:mm' timeframe like the GUI date inputs """
+    return pd.to_datetime(start, format='%Y-%m-%d %H:%M'), pd.to_datetime(end, format='%Y-%m-%d %H:%M')
+
+def timeframe_stamp(start, end):
+    return f"{start:%Y%m%d-%H%M}_{end:%Y%m%d-%H%M}"
+
+def process_instrument(folder, instrument_nr, windows, out_dir, formats, stream=False, chunksize=STREAM_CHUNKSIZE,
+                       cache_dir=RESULT_CACHE_DIR):
+    """ Batch job: load one instrument folder, write its statistics text and charts; returns (instrument_nr, timings)
+        Statistics and chart files of earlier runs on the same files are taken from the result cache in 'cache_dir' """
+    if stream:
+        return process_instrument_streaming(folder, instrument_nr, windows, out_dir, chunksize)
+    timings = {}
+    started = time.perf_counter()
+    store = load_log_data(folder)
+    timings['load'] = time.perf_counter() - started
+    cache = ResultCache(cache_dir) if cache_dir is not None else None
+
+    # Statistics of every timeframe (the whole log if none given) in one text file
+    t = time.perf_counter()
+    reports = []
+    for start, end in windows or [(store.time_index.start, store.time_index.end)]:
+        if not store.time_index.contains(start, end):
+            reports.append(f"Incubation log statistics; {instrument_nr}\nSeleceted timeframe: {start} - {end}\n\n"
+                           f"Enter a valid date range between {store.time_index.start} and {store.time_index.end}.")
+            continue
+        stats = statistics_job(store, start, end, cache=cache, instrument_nr=instrument_nr)
+        reports.append(stats_report(stats, instrument_nr) if stats is not None else "No data available for the specified date range.")
+    with open(os.path.join(out_dir, f"{instrument_nr}_statistics.txt"), 'w', encoding='utf-8') as f:
+        f.write("\n\n\n".join(reports) + "\n")
+    timings['statistics'] = time.perf_counter() - t
+
+    # Overview chart plus one chart zoomed to every timeframe, rendered off-screen with Agg
+    t = time.perf_counter()
+    charts = [(None, f"{instrument_nr}_charts")] + [((start, end), f"{instrument_nr}_charts_{timeframe_stamp(start, end)}")
+                                                    for start, end in windows if store.time_index.contains(start, end)]
+    keys = {}
+    if cache is not None:
+        keys = {(window, fmt): cache.key(store.fingerprint, 'image', instrument_nr, window, fmt, CHART_FIGSIZE,
+                                         matplotlib.__version__) for window, name in charts for fmt in formats}
+    images = {window_fmt: cache.get(key) for window_fmt, key in keys.items()}
+    if images and all(data is not None for data in images.values()):
+        # Every file was rendered before from the same log files
+        for window, name in charts:
+            for fmt in formats:
+                with open(os.path.join(out_dir, f"{name}.{fmt}"), 'wb') as f:
+                    f.write(images[(window, fmt)])
+    else:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=CHART_FIGSIZE)
+        FigureCanvasAgg(fig)
+        axes = draw_chart_figure(fig, prepare_chart_data(store, rollups_job(store)), instrument_nr)
+        for window, name in charts:
+            if window is not None:
+                zoom_chart_figure(axes, store, instrument_nr, *window)
+            for fmt in formats:
+                path = os.path.join(out_dir, f"{name}.{fmt}")
+                fig.savefig(path)
+                if cache is not None:
+                    with open(path, 'rb') as f:
+                        cache.put(keys[(window, fmt)], f.read())
+    timings['charts'] = time.perf_counter() - t
+    timings['total'] = time.perf_counter() - started
+    return instrument_nr, timings
+
+def process_instrument_streaming(folder, instrument_nr, windows, out_dir, chunksize=STREAM_CHUNKSIZE):
+    """ Batch job in streaming mode: statistics of all timeframes in one chunked pass, no charts """
+    timings = {}
+    started = time.perf_counter()
+    if not windows:
+        # The whole log; its range is only known after a first pass over the 'Time' column
+        windows = [scan_log_range(folder, chunksize)]
+    results, (first_time, last_time) = stream_statistics(folder, windows, chunksize)
+    reports = []
+    for (start, end), stats in zip(windows, results):
+        # The pass only stops early beyond the last timeframe, so an end after the last row read is out of range
+        if first_time is None or start < first_time or end > last_time:
+            reports.append(f"Incubation log statistics; {instrument_nr}\nSeleceted timeframe: {start} - {end}\n\n"
+                           f"Enter a valid date range between {first_time} and {last_time}.")
+            continue
+        reports.append(stats_report(stats, instrument_nr) if stats is not None else "No data available for the specified date range.")
+    with open(os.path.join(out_dir, f"{instrument_nr}_statistics.txt"), 'w', encoding='utf-8') as f:
+        f.write("\n\n\n".join(reports) + "\n")
+    timings['statistics'] = time.perf_counter() - started
+    timings['total'] = time.perf_counter() - started
+    return instrument_nr, timings
+
+def run_batch(argv):
+    """ Headless batch mode: statistics and charts of many instrument folders on a process pool, without a GUI """
+    parser = argparse.ArgumentParser(prog=os.path.basename(sys.argv[0]),
+                                     description="Compute incubation log statistics and render charts without the GUI.")
+    parser.add_argument('--batch', nargs='+', required=True, metavar='[INSTRUMENT=]FOLDER',
+                        help="instrument log folders; the instrument nr. defaults to the folder name")
+    parser.add_argument('--window', nargs=2, action='append', default=[], metavar=('START', 'END'),
+                        help="timeframe 'YYYY-MM-DD hh:mm' 'YYYY-MM-DD hh:mm'; may be repeated (default: whole log)")
+    parser.add_argument('--out', default='.', help="output folder (default: current folder)")
+    parser.add_argument('--format', nargs='+', default=['png'], choices=['png', 'pdf'], help="chart file formats")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--stream', action='store_true',
+                        help="read the CSV files in chunks with bounded memory; statistics only, no charts")
+    parser.add_argument('--chunksize', type=int, default=STREAM_CHUNKSIZE, help="rows per chunk in streaming mode")
+    parser.add_argument('--no-cache', action='store_true', help="neither use nor update the result cache")
+    args = parser.parse_args(argv)
+
+    try:
+        windows = [parse_timeframe(start, end) for start, end in args.window]
+    except ValueError:
+        parser.error("Enter valid date and time in the format YYYY-MM-DD hh:mm.")
+    if any(start >= end for start, end in windows):
+        parser.error("Start date must be less than end date.")
+    jobs = []
+    for entry in args.batch:
+        instrument_nr, sep, folder = entry.partition('=')
+        if not (sep and os.path.isdir(folder)):
+            instrument_nr, folder = os.path.basename(os.path.normpath(entry)), entry
+        jobs.append((instrument_nr, folder))
+    os.makedirs(args.out, exist_ok=True)
+
+    # Charts are rendered off-screen
+    matplotlib.use('Agg')
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(process_instrument, folder, instrument_nr, windows, args.out, args.format,
+                               args.stream, args.chunksize, None if args.no_cache else RESULT_CACHE_DIR): instrument_nr
+                   for instrument_nr, folder in jobs}
+        for future in as_completed(futures):
+            try:
+                instrument_nr, timings = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"{futures[future]}: failed: {e}", file=sys.stderr)
+                continue
+            print(f"{instrument_nr}: " + "  ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()))
+    return 1 if failed else 0
 
 def main():
+    # Headless batch mode runs without a QApplication
+    if '--batch' in sys.argv[1:]:
+        sys.exit(run_batch(sys.argv[1:]))
+    if '--import-report' in sys.argv[1:]:
+        import_all()
+        print(import_report())
+        sys.exit(0)
     app = QApplication(sys.argv)
     font = QFont("Monaco", 8)
     app.setFont(font)
     ex = MainApp()
     ex.show()
+    # Runs once the event loop has drawn the window
+    QTimer.singleShot(0, prewarm_imports)
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
+    # Needed by the batch mode process pool in the PyInstaller build
+    multiprocessing.freeze_support()
     main()
 